@@ -0,0 +1,272 @@
+"""Reproducible solver/generator benchmark.
+
+Builds a fixed corpus of puzzles with seeded CrosswordGenerator runs, solves
+each one headlessly with every selected solver configuration and writes the
+measurements as JSON:
+
+    python -m benchmarks.solver_benchmark -o bench.json
+    python -m benchmarks.solver_benchmark -o new.json --compare bench.json
+
+Generated grids depend on the generator's code, so ``--save-corpus`` /
+``--corpus`` freeze a corpus to compare solver changes on identical input.
+
+The pattern and value-ordering caches are shared per process, so they are
+emptied before every run: each result measures its configuration cold,
+whatever ran before it.
+"""
+import argparse
+import hashlib
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.dictionary.word_loader import get_dictionary
+from src.generator.generator import CrosswordGenerator
+from src.solver.backtracking import CrosswordSolver
+from src.solver.value_ordering import shared_value_ordering
+
+
+# (grid size, words to place): a sparse and a dense layout per size.
+DEFAULT_LAYOUTS = [(9, 6), (9, 10), (13, 13), (13, 22), (15, 15), (15, 30)]
+# Fractions of the solution's letters pre-filled in the puzzle.
+DEFAULT_REVEALED = (0.0, 0.1, 0.3)
+DEFAULT_SEEDS = 3
+
+CONFIGS = {
+    "default": {},
+    "backjumping": {"backjumping": True},
+    "forward_checking": {"inference": "forward_checking"},
+    "ac3": {"inference": "ac3"},
+    "ac3_backjumping": {"inference": "ac3", "backjumping": True},
+    "numpy": {"backend": "numpy"},
+    "lcv": {"value_order": "lcv"},
+    "forward_checking_lcv": {"inference": "forward_checking", "value_order": "lcv"},
+}
+
+
+def generate_layout(size, num_words, seed):
+    start = time.perf_counter()
+    grid, words = CrosswordGenerator(size=size, seed=seed).generate(num_words=num_words)
+    return grid, words, time.perf_counter() - start
+
+
+def build_puzzle(grid, words, revealed, seed):
+    rng = random.Random(seed)
+    puzzle = [
+        ["#" if cell == "#" else (cell if rng.random() < revealed else " ") for cell in row]
+        for row in grid
+    ]
+    fingerprint = hashlib.sha1(
+        "\n".join("".join(row) for row in puzzle).encode()).hexdigest()[:12]
+    return {
+        "id": f"s{len(grid)}-w{len(words)}-r{revealed}-seed{seed}",
+        "size": len(grid),
+        "num_words": len(words),
+        "revealed": revealed,
+        "seed": seed,
+        "fingerprint": fingerprint,
+        "grid": puzzle,
+    }
+
+
+def build_corpus(layouts, revealed_fractions, seeds):
+    puzzles = []
+    for size, num_words in layouts:
+        for seed in seeds:
+            grid, words, generation_time = generate_layout(size, num_words, seed)
+            for revealed in revealed_fractions:
+                puzzle = build_puzzle(grid, words, revealed, seed)
+                puzzle["generation_time"] = generation_time
+                puzzles.append(puzzle)
+    return puzzles
+
+
+def clear_caches(dictionary):
+    dictionary.pattern_cache.clear()
+    shared_value_ordering(dictionary).clear()
+
+
+def pattern_cache_lookups(solver):
+    stats = solver.dictionary.pattern_cache.stats()
+    return (stats["id_hits"] + stats["count_hits"], stats["id_misses"] + stats["count_misses"])
+
+
+def run_solver(grid, options, node_limit, time_limit):
+    solver = CrosswordSolver(grid, **options)
+    num_variables = len(solver.variables)
+    hits_before, misses_before = pattern_cache_lookups(solver)
+    nodes = 0
+    backtracks = 0
+    depth = 0
+    status = "unsatisfiable"
+
+    start = time.perf_counter()
+    deadline = start + time_limit
+    for assignment in solver.solve():
+        if nodes:
+            # Between two nodes the solver undoes some assignments and adds one.
+            backtracks += max(0, depth + 1 - len(assignment))
+        nodes += 1
+        depth = len(assignment)
+        if depth == num_variables:
+            status = "solved"
+            break
+        if nodes >= node_limit:
+            status = "node_limit"
+            break
+        if time.perf_counter() >= deadline:
+            status = "time_limit"
+            break
+    elapsed = time.perf_counter() - start
+    hits, misses = pattern_cache_lookups(solver)
+
+    return {
+        "status": status,
+        "variables": num_variables,
+        "time": elapsed,
+        "nodes": nodes,
+        "backtracks": backtracks,
+        "pattern_cache_hits": hits - hits_before,
+        "pattern_cache_misses": misses - misses_before,
+    }
+
+
+def measure_peak_memory(grid, options, node_limit, time_limit):
+    # The timed run has just filled the caches; refilling them is part of
+    # what a solve costs.
+    clear_caches(get_dictionary())
+    tracemalloc.start()
+    try:
+        run_solver(grid, options, node_limit, time_limit)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(configs, puzzles, node_limit, time_limit, memory=True, log=sys.stderr):
+    dictionary = get_dictionary()
+    results = []
+    for puzzle in puzzles:
+        for name in configs:
+            options = CONFIGS[name]
+            clear_caches(dictionary)
+            result = run_solver(puzzle["grid"], options, node_limit, time_limit)
+            if memory:
+                result["peak_memory"] = measure_peak_memory(
+                    puzzle["grid"], options, node_limit, time_limit)
+            result.update(puzzle=puzzle["id"], config=name)
+            results.append(result)
+            print(
+                f"{puzzle['id']:<28} {name:<18} {result['status']:<14}"
+                f"{result['time']:9.4f}s {result['nodes']:>9} nodes",
+                file=log,
+            )
+
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "node_limit": node_limit,
+        "time_limit": time_limit,
+        "puzzles": [
+            {key: value for key, value in puzzle.items() if key != "grid"}
+            for puzzle in puzzles
+        ],
+        "results": results,
+        "summary": summarize(results),
+        # Hits and misses add up every run; the entries are the last run's.
+        "pattern_cache": dictionary.pattern_cache.stats(),
+    }
+
+
+def summarize(results):
+    summary = {}
+    for result in results:
+        totals = summary.setdefault(result["config"], {
+            "puzzles": 0, "solved": 0, "time": 0.0, "nodes": 0, "backtracks": 0,
+            "peak_memory": 0, "pattern_cache_hits": 0, "pattern_cache_misses": 0,
+        })
+        totals["puzzles"] += 1
+        totals["solved"] += result["status"] == "solved"
+        totals["time"] += result["time"]
+        totals["nodes"] += result["nodes"]
+        totals["backtracks"] += result["backtracks"]
+        totals["pattern_cache_hits"] += result["pattern_cache_hits"]
+        totals["pattern_cache_misses"] += result["pattern_cache_misses"]
+        totals["peak_memory"] = max(totals["peak_memory"], result.get("peak_memory", 0))
+    return summary
+
+
+def compare(report, baseline, out=sys.stdout):
+    for name, totals in report["summary"].items():
+        before = baseline["summary"].get(name)
+        if before is None:
+            continue
+        ratios = "  ".join(
+            f"{key} x{totals[key] / before[key]:.2f}"
+            for key in ("time", "nodes", "backtracks", "peak_memory")
+            if before[key] and totals[key]
+        )
+        print(f"{name:<18} solved {before['solved']}->{totals['solved']}  {ratios}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--configs", default=",".join(CONFIGS),
+                        help=f"comma-separated subset of: {', '.join(CONFIGS)}")
+    parser.add_argument("--seeds", type=int, default=DEFAULT_SEEDS,
+                        help="number of seeds per corpus entry")
+    parser.add_argument("--sizes", help="comma-separated grid sizes to keep")
+    parser.add_argument("--node-limit", type=int, default=200_000)
+    parser.add_argument("--time-limit", type=float, default=30.0)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc pass used for peak memory")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument("--corpus", help="load puzzles from a saved corpus instead of generating")
+    parser.add_argument("--save-corpus", help="write the puzzles used to this JSON file")
+    args = parser.parse_args(argv)
+
+    configs = args.configs.split(",")
+    unknown = [name for name in configs if name not in CONFIGS]
+    if unknown:
+        parser.error(f"unknown configs: {', '.join(unknown)}")
+    sizes = {int(size) for size in args.sizes.split(",")} if args.sizes else None
+    if args.corpus:
+        puzzles = json.loads(Path(args.corpus).read_text())
+        if sizes:
+            puzzles = [puzzle for puzzle in puzzles if puzzle["size"] in sizes]
+    else:
+        layouts = [layout for layout in DEFAULT_LAYOUTS if not sizes or layout[0] in sizes]
+        puzzles = build_corpus(layouts, DEFAULT_REVEALED, range(args.seeds))
+    if args.save_corpus:
+        Path(args.save_corpus).write_text(json.dumps(puzzles) + "\n")
+
+    report = run_benchmark(
+        configs, puzzles, args.node_limit, args.time_limit, memory=not args.no_memory)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        compare(report, json.loads(Path(args.compare).read_text()), out=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Compiled binary dictionary format.
+
+Layout (all integers little-endian):
+
+    header   MAGIC, uint32 number of length sections
+    table    per section: uint32 length, uint32 word count,
+             uint64 words offset, uint64 index offset, uint32 index entries
+    words    per section: word count * length bytes, sorted, latin-1
+    index    per section: (uint32 position, uint32 letter code point,
+             bitset of ceil(word count / 8) bytes) for every entry
+
+Sections start on 8-byte boundaries. Loading maps the file read-only, so
+every process that opens the same artifact shares its pages.
+"""
+import argparse
+import bisect
+import mmap
+import struct
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from src.dictionary.dictionary import Dictionary, dictionary_version
+from src.dictionary.pattern_cache import PatternCache
+from src.dictionary.word_index import WordIndex
+
+
+MAGIC = b"CWDICT\x00\x01"
+ENCODING = "latin-1"
+
+_HEADER = struct.Struct("<8sI")
+_SECTION = struct.Struct("<IIQQI")
+_ENTRY = struct.Struct("<II")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def is_compiled_dictionary(path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def compile_dictionary(words: Iterable[str], output_path) -> Path:
+    dictionary = words if isinstance(words, Dictionary) else Dictionary(words)
+    words_by_length = dictionary.words_by_length
+    word_index = dictionary.word_index
+
+    sections = []
+    offset = _align(_HEADER.size + _SECTION.size * len(words_by_length))
+    for length, bucket in words_by_length.items():
+        words_blob = "".join(bucket).encode(ENCODING)
+        if len(words_blob) != length * len(bucket):
+            raise ValueError(f"words of length {length} are not single-byte encodable")
+        words_offset = offset
+        offset = _align(offset + len(words_blob))
+
+        num_bytes = (len(bucket) + 7) // 8
+        entries = []
+        for position, masks in enumerate(word_index.position_masks[length]):
+            for letter in sorted(masks):
+                entries.append(
+                    _ENTRY.pack(position, ord(letter))
+                    + masks[letter].to_bytes(num_bytes, "little")
+                )
+        index_blob = b"".join(entries)
+        index_offset = offset
+        offset = _align(offset + len(index_blob))
+
+        sections.append(
+            (length, len(bucket), words_offset, words_blob, index_offset, index_blob, len(entries))
+        )
+
+    output_path = Path(output_path)
+    with open(output_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(sections)))
+        for length, count, words_offset, _, index_offset, _, num_entries in sections:
+            f.write(_SECTION.pack(length, count, words_offset, index_offset, num_entries))
+        for _, _, words_offset, words_blob, index_offset, index_blob, _ in sections:
+            f.write(b"\x00" * (words_offset - f.tell()))
+            f.write(words_blob)
+            f.write(b"\x00" * (index_offset - f.tell()))
+            f.write(index_blob)
+    return output_path
+
+
+class PackedWords(Sequence):
+    """Read-only, sorted view of fixed-width words stored in a buffer."""
+
+    def __init__(self, buffer, offset: int, length: int, count: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word index out of range")
+        start = self._offset + index * self._length
+        return self._buffer[start:start + self._length].decode(ENCODING)
+
+    def __iter__(self):
+        end = self._offset + self._count * self._length
+        blob = self._buffer[self._offset:end].decode(ENCODING)
+        for start in range(0, len(blob), self._length):
+            yield blob[start:start + self._length]
+
+    def __contains__(self, word) -> bool:
+        i = bisect.bisect_left(self, word)
+        return i < self._count and self[i] == word
+
+
+class PackedLetterMasks:
+    """Bitsets for one (length, position), decoded from the buffer on first use."""
+
+    def __init__(self, buffer, num_bytes: int, offsets: Dict[str, int]):
+        self._buffer = buffer
+        self._num_bytes = num_bytes
+        self._offsets = offsets
+        self._masks = {}
+
+    def get(self, letter: str, default: int = 0) -> int:
+        mask = self._masks.get(letter)
+        if mask is None:
+            offset = self._offsets.get(letter)
+            if offset is None:
+                return default
+            mask = int.from_bytes(
+                self._buffer[offset:offset + self._num_bytes], "little")
+            self._masks[letter] = mask
+        return mask
+
+    def __getitem__(self, letter: str) -> int:
+        if letter not in self._offsets:
+            raise KeyError(letter)
+        return self.get(letter)
+
+    def __contains__(self, letter: str) -> bool:
+        return letter in self._offsets
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+class CompiledDictionary:
+    """Dictionary backed by a memory-mapped compiled artifact.
+
+    Provides the same ``words_by_length`` / ``word_index`` interface as
+    ``Dictionary`` without materialising a Python string per word.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = self._mmap
+
+        magic, num_sections = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a compiled dictionary")
+
+        self.words_by_length: Dict[int, PackedWords] = {}
+        position_masks = {}
+        for i in range(num_sections):
+            length, count, words_offset, index_offset, num_entries = _SECTION.unpack_from(
+                buffer, _HEADER.size + i * _SECTION.size)
+            self.words_by_length[length] = PackedWords(buffer, words_offset, length, count)
+
+            num_bytes = (count + 7) // 8
+            offsets = [{} for _ in range(length)]
+            entry_size = _ENTRY.size + num_bytes
+            for j in range(num_entries):
+                entry_offset = index_offset + j * entry_size
+                position, code_point = _ENTRY.unpack_from(buffer, entry_offset)
+                offsets[position][chr(code_point)] = entry_offset + _ENTRY.size
+            position_masks[length] = [
+                PackedLetterMasks(buffer, num_bytes, letter_offsets)
+                for letter_offsets in offsets
+            ]
+
+        self.word_index = WordIndex(self.words_by_length, position_masks)
+        self._numpy_index = None
+        self._pattern_cache = None
+        self._words = None
+        self._version = None
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = dictionary_version(self.words_by_length)
+        return self._version
+
+    @property
+    def words(self) -> frozenset:
+        if self._words is None:
+            self._words = frozenset(
+                word for bucket in self.words_by_length.values() for word in bucket)
+        return self._words
+
+    @property
+    def pattern_cache(self) -> PatternCache:
+        if self._pattern_cache is None:
+            self._pattern_cache = PatternCache(self.word_index)
+        return self._pattern_cache
+
+    @property
+    def numpy_index(self):
+        if self._numpy_index is None:
+            from src.dictionary.numpy_index import NumpyWordIndex
+
+            self._numpy_index = NumpyWordIndex(self.words_by_length)
+        return self._numpy_index
+
+    def __contains__(self, word: str) -> bool:
+        bucket = self.words_by_length.get(len(word))
+        return bucket is not None and word in bucket
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.words_by_length.values())
+
+    def __reduce__(self):
+        # Worker processes re-map the file instead of copying its contents.
+        return (CompiledDictionary, (str(self.path),))
+
+
+def main(argv: Optional[list] = None):
+    from src.dictionary.word_loader import DEFAULT_WORD_FILE, load_words
+
+    parser = argparse.ArgumentParser(
+        description="Compile a word list into a memory-mappable dictionary.")
+    parser.add_argument("word_file", nargs="?", default=str(DEFAULT_WORD_FILE))
+    parser.add_argument("-o", "--output", help="defaults to the word file with a .bin suffix")
+    args = parser.parse_args(argv)
+
+    output = args.output or Path(args.word_file).with_suffix(".bin")
+    path = compile_dictionary(load_words(args.word_file), output)
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
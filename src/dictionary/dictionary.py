@@ -0,0 +1,69 @@
+import hashlib
+from typing import Dict, Iterable, Sequence, Tuple
+
+from src.dictionary.pattern_cache import PatternCache
+from src.dictionary.word_index import WordIndex
+
+
+def dictionary_version(words_by_length: Dict[int, Sequence[str]]) -> str:
+    """Content hash of a word list, independent of how it is stored."""
+    digest = hashlib.sha1()
+    for length, bucket in words_by_length.items():
+        digest.update(f"{length}:{len(bucket)}\n".encode())
+        digest.update("\n".join(bucket).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class Dictionary:
+    """Immutable word list with length buckets and lazily built indexes.
+
+    Words inside each bucket are sorted, so word ids are stable for a given
+    word list.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words = frozenset(words)
+
+        words_by_length = {}
+        for word in sorted(self.words):
+            words_by_length.setdefault(len(word), []).append(word)
+        self.words_by_length: Dict[int, Tuple[str, ...]] = {
+            length: tuple(bucket) for length, bucket in sorted(words_by_length.items())
+        }
+        self._word_index = None
+        self._numpy_index = None
+        self._pattern_cache = None
+        self._version = None
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = dictionary_version(self.words_by_length)
+        return self._version
+
+    @property
+    def word_index(self) -> WordIndex:
+        if self._word_index is None:
+            self._word_index = WordIndex(self.words_by_length)
+        return self._word_index
+
+    @property
+    def pattern_cache(self) -> PatternCache:
+        """Process-wide memo of ``word_index`` pattern queries."""
+        if self._pattern_cache is None:
+            self._pattern_cache = PatternCache(self.word_index)
+        return self._pattern_cache
+
+    @property
+    def numpy_index(self):
+        if self._numpy_index is None:
+            from src.dictionary.numpy_index import NumpyWordIndex
+
+            self._numpy_index = NumpyWordIndex(self.words_by_length)
+        return self._numpy_index
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
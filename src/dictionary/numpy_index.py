@@ -0,0 +1,70 @@
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is only needed for this backend
+    np = None
+
+
+class NumpyWordIndex:
+    """Vectorised pattern matching over words grouped by length.
+
+    Each length bucket is stored as a (positions x words) array of character
+    codes, so a pattern is matched by comparing one contiguous row per known
+    letter and AND-ing the boolean masks. Word ids are bucket positions, as
+    in ``WordIndex``.
+    """
+
+    def __init__(self, words_by_length: Dict[int, Sequence[str]]):
+        if np is None:
+            raise ImportError("the numpy backend requires numpy to be installed")
+        self.words_by_length = words_by_length
+        self.matrices = {
+            length: self._build_matrix(length, words)
+            for length, words in words_by_length.items()
+        }
+
+    @staticmethod
+    def _build_matrix(length: int, words: Sequence[str]):
+        try:
+            codes = np.frombuffer("".join(words).encode("latin-1"), dtype=np.uint8)
+        except UnicodeEncodeError:
+            codes = np.array(list(words), dtype=f"<U{length}").view(np.uint32)
+        return np.ascontiguousarray(codes.reshape(len(words), length).T)
+
+    def match_array(self, length: int, pattern: Sequence[str]):
+        """Boolean mask over the bucket, or None when nothing is constrained."""
+        matrix = self.matrices.get(length)
+        if matrix is None:
+            return np.zeros(0, dtype=bool)
+        mask = None
+        for i, char in enumerate(pattern):
+            if char == "":
+                continue
+            code = ord(char)
+            if code > np.iinfo(matrix.dtype).max:
+                return np.zeros(matrix.shape[1], dtype=bool)
+            if mask is None:
+                mask = matrix[i] == code
+            else:
+                mask &= matrix[i] == code
+        return mask
+
+    def count(self, length: int, pattern: Sequence[str]) -> int:
+        mask = self.match_array(length, pattern)
+        if mask is None:
+            return len(self.words_by_length[length])
+        return int(np.count_nonzero(mask))
+
+    def match(self, length: int, pattern: Sequence[str]) -> List[str]:
+        mask = self.match_array(length, pattern)
+        words = self.words_by_length.get(length, ())
+        if mask is None:
+            return list(words)
+        return [words[word_id] for word_id in np.flatnonzero(mask).tolist()]
+
+    def match_ids(self, length: int, pattern: Sequence[str]) -> List[int]:
+        mask = self.match_array(length, pattern)
+        if mask is None:
+            return list(range(len(self.words_by_length.get(length, ()))))
+        return np.flatnonzero(mask).tolist()
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from typing import List, Sequence
+
+
+class PatternCache:
+    """Bounded LRU memo of pattern queries in front of a word index.
+
+    Candidate id lists and counts are cached separately, keyed by the
+    pattern's length and letters; ``count`` is answered from a cached id
+    list when there is one. At most ``max_entries`` patterns are kept of
+    each kind, and the cached id lists hold at most ``max_ids`` ids in
+    total. Returned id lists are shared, so callers must copy them before
+    modifying them.
+    """
+
+    def __init__(self, index, max_entries: int = 65536, max_ids: int = 4_000_000):
+        self.index = index
+        self.words_by_length = index.words_by_length
+        self.max_entries = max_entries
+        self.max_ids = max_ids
+        self._ids: "OrderedDict[tuple, List[int]]" = OrderedDict()
+        self._counts: "OrderedDict[tuple, int]" = OrderedDict()
+        self._num_ids = 0
+        self.id_hits = 0
+        self.id_misses = 0
+        self.count_hits = 0
+        self.count_misses = 0
+
+    def match_ids(self, length: int, pattern: Sequence[str]) -> List[int]:
+        key = (length, tuple(pattern))
+        ids = self._ids.get(key)
+        if ids is not None:
+            self._ids.move_to_end(key)
+            self.id_hits += 1
+            return ids
+
+        self.id_misses += 1
+        ids = self.index.match_ids(length, pattern)
+        if len(ids) <= self.max_ids:
+            self._ids[key] = ids
+            self._num_ids += len(ids)
+            while len(self._ids) > self.max_entries or self._num_ids > self.max_ids:
+                _, evicted = self._ids.popitem(last=False)
+                self._num_ids -= len(evicted)
+        return ids
+
+    def count(self, length: int, pattern: Sequence[str]) -> int:
+        key = (length, tuple(pattern))
+        ids = self._ids.get(key)
+        if ids is not None:
+            self._ids.move_to_end(key)
+            self.count_hits += 1
+            return len(ids)
+        count = self._counts.get(key)
+        if count is not None:
+            self._counts.move_to_end(key)
+            self.count_hits += 1
+            return count
+
+        self.count_misses += 1
+        count = self.index.count(length, pattern)
+        self._counts[key] = count
+        if len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+        return count
+
+    def match(self, length: int, pattern: Sequence[str]) -> List[str]:
+        words = self.words_by_length.get(length, ())
+        return [words[word_id] for word_id in self.match_ids(length, pattern)]
+
+    def clear(self):
+        self._ids.clear()
+        self._counts.clear()
+        self._num_ids = 0
+
+    def stats(self) -> dict:
+        return {
+            "id_entries": len(self._ids),
+            "stored_ids": self._num_ids,
+            "id_hits": self.id_hits,
+            "id_misses": self.id_misses,
+            "count_entries": len(self._counts),
+            "count_hits": self.count_hits,
+            "count_misses": self.count_misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._ids) + len(self._counts)
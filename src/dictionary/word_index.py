@@ -0,0 +1,133 @@
+import bisect
+from typing import Dict, List, Mapping, Optional, Sequence
+
+
+# Set bit offsets for every byte value, used to turn a bitset back into ids.
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1)
+              for byte in range(256)]
+
+
+def mask_to_ids(mask: int) -> List[int]:
+    ids = []
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index * 8
+            ids.extend(base + bit for bit in _BYTE_BITS[byte])
+    return ids
+
+
+class WordIndex:
+    """Positional letter index over words grouped by length.
+
+    A word's id is its position in its length bucket. For every
+    (length, position, letter) the index keeps a bitset (a Python int) of
+    the ids of words having that letter at that position, so a pattern is
+    resolved by AND-ing one bitset per known letter.
+    """
+
+    def __init__(
+        self,
+        words_by_length: Dict[int, Sequence[str]],
+        position_masks: Optional[Dict[int, Sequence[Mapping[str, int]]]] = None,
+    ):
+        self.words_by_length = words_by_length
+        self.full_masks = {}
+        self.position_masks = {}
+        self._letter_frequencies = {}
+        for length, words in words_by_length.items():
+            self.full_masks[length] = (1 << len(words)) - 1
+            if position_masks is not None:
+                self.position_masks[length] = position_masks[length]
+            else:
+                self.position_masks[length] = self._build_position_masks(
+                    length, words)
+
+    @staticmethod
+    def _build_position_masks(length: int, words: Sequence[str]) -> List[Dict[str, int]]:
+        position_ids = [{} for _ in range(length)]
+        for word_id, word in enumerate(words):
+            for i, char in enumerate(word):
+                position_ids[i].setdefault(char, []).append(word_id)
+
+        num_bytes = (len(words) + 7) // 8
+        position_masks = []
+        for ids_by_letter in position_ids:
+            masks = {}
+            for char, ids in ids_by_letter.items():
+                bits = bytearray(num_bytes)
+                for word_id in ids:
+                    bits[word_id >> 3] |= 1 << (word_id & 7)
+                masks[char] = int.from_bytes(bits, "little")
+            position_masks.append(masks)
+        return position_masks
+
+    def word_id(self, word: str) -> Optional[int]:
+        """Return the id of a word, relying on buckets being sorted."""
+        words = self.words_by_length.get(len(word), ())
+        word_id = bisect.bisect_left(words, word)
+        if word_id < len(words) and words[word_id] == word:
+            return word_id
+        return None
+
+    def letter_mask(self, length: int, position: int, letter: str) -> int:
+        position_masks = self.position_masks.get(length)
+        if position_masks is None:
+            return 0
+        return position_masks[position].get(letter, 0)
+
+    def match_mask(self, length: int, pattern: Sequence[str]) -> int:
+        mask = self.full_masks.get(length, 0)
+        if not mask:
+            return 0
+        position_masks = self.position_masks[length]
+        for i, char in enumerate(pattern):
+            if char != "":
+                mask &= position_masks[i].get(char, 0)
+                if not mask:
+                    return 0
+        return mask
+
+    def letters_at(self, length: int, position: int, mask: int) -> List[str]:
+        position_masks = self.position_masks.get(length)
+        if position_masks is None:
+            return []
+        masks = position_masks[position]
+        return [letter for letter in masks if masks.get(letter) & mask]
+
+    def letter_frequencies(self, length: int) -> List[Dict[str, int]]:
+        """Per position, how many words of this length have each letter there."""
+        frequencies = self._letter_frequencies.get(length)
+        if frequencies is None:
+            frequencies = [
+                {letter: masks.get(letter).bit_count() for letter in masks}
+                for masks in self.position_masks.get(length, ())
+            ]
+            self._letter_frequencies[length] = frequencies
+        return frequencies
+
+    def letter_counts(self, length: int, position: int, mask: int) -> Dict[str, int]:
+        """How many words in ``mask`` have each letter at ``position``."""
+        position_masks = self.position_masks.get(length)
+        if position_masks is None:
+            return {}
+        masks = position_masks[position]
+        counts = {}
+        for letter in masks:
+            count = (masks.get(letter) & mask).bit_count()
+            if count:
+                counts[letter] = count
+        return counts
+
+    def count(self, length: int, pattern: Sequence[str]) -> int:
+        return self.match_mask(length, pattern).bit_count()
+
+    def words_from_mask(self, length: int, mask: int) -> List[str]:
+        words = self.words_by_length[length] if mask else ()
+        return [words[word_id] for word_id in mask_to_ids(mask)]
+
+    def match(self, length: int, pattern: Sequence[str]) -> List[str]:
+        return self.words_from_mask(length, self.match_mask(length, pattern))
+
+    def match_ids(self, length: int, pattern: Sequence[str]) -> List[int]:
+        return mask_to_ids(self.match_mask(length, pattern))
@@ -1,8 +1,50 @@
+from functools import lru_cache
 from pathlib import Path
 
+from src.dictionary.compiled import CompiledDictionary, is_compiled_dictionary
+from src.dictionary.dictionary import Dictionary
 
-def load_words():
-    word_file = Path(__file__).parent.parent / "data" / "words.txt"
+
+DEFAULT_WORD_FILE = Path(__file__).parent.parent / "data" / "words.txt"
+# Built with `python -m src.dictionary.compiled`; used when newer than the word file.
+DEFAULT_COMPILED_FILE = DEFAULT_WORD_FILE.with_suffix(".bin")
+
+
+def load_words(word_file=None):
+    if word_file is None:
+        word_file = DEFAULT_WORD_FILE
     with open(word_file, "r") as f:
         words = {line.strip() for line in f if line.strip().isalpha()}
     return words
+
+
+def get_dictionary(word_file=None):
+    """Return the process-wide dictionary for a word list.
+
+    The word file is parsed and indexed once per process; every later call
+    with the same file returns the same shared instance. Compiled artifacts
+    are memory-mapped instead of parsed.
+    """
+    if word_file is None:
+        word_file = _default_word_file()
+    return _get_cached_dictionary(Path(word_file).resolve())
+
+
+def _default_word_file() -> Path:
+    if (
+        DEFAULT_COMPILED_FILE.exists()
+        and DEFAULT_COMPILED_FILE.stat().st_mtime >= DEFAULT_WORD_FILE.stat().st_mtime
+    ):
+        return DEFAULT_COMPILED_FILE
+    return DEFAULT_WORD_FILE
+
+
+@lru_cache(maxsize=None)
+def _get_cached_dictionary(word_file: Path):
+    if is_compiled_dictionary(word_file):
+        return CompiledDictionary(word_file)
+    return Dictionary(load_words(word_file))
+
+
+def clear_dictionary_cache():
+    _get_cached_dictionary.cache_clear()
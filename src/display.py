@@ -1,27 +1,122 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+"""Drawing crosswords on screen or to files.
 
+``display_crossword`` and ``animate_solution`` show an interactive window
+unless ``output`` is given, in which case they render headlessly:
 
-def display_crossword(grid, words):
-    fig, ax = plt.subplots(1, 1, figsize=(8, 8))
+    .svg / .txt         written directly, without importing matplotlib
+    .png / .pdf / ...   a still image through matplotlib's Agg renderer
+    .gif / .mp4         an animation (GIF needs pillow, MP4 needs ffmpeg)
 
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.set_frame_on(False)
+Matplotlib drawings create the cell artists once; animation frames only
+change the text of cells whose letter changed and are blitted.
+"""
+from html import escape
+from pathlib import Path
 
-    rows, cols = len(grid), len(grid[0])
 
+TEXT_FORMATS = (".svg", ".txt")
+ANIMATION_FORMATS = (".gif", ".mp4")
+
+
+def clue_numbers(words):
+    numbers = {}
+    for word_info in sorted(words, key=lambda x: (x["row"], x["col"])):
+        start = (word_info["row"], word_info["col"])
+        if start not in numbers:
+            numbers[start] = len(numbers) + 1
+    return numbers
+
+
+def fill_grid(grid, assignment):
+    filled = [list(row) for row in grid]
+    for (r, c, direction, length), word in assignment.items():
+        for i in range(length):
+            if direction == "across":
+                filled[r][c + i] = word[i]
+            else:
+                filled[r + i][c] = word[i]
+    return filled
+
+
+def render_text(grid):
+    return "\n".join("".join("█" if cell == "#" else cell for cell in row) for row in grid) + "\n"
+
+
+def render_svg(grid, words=(), cell_size=32):
+    """Standalone SVG of the grid, built without matplotlib."""
+    rows, cols = len(grid), len(grid[0])
+    numbers = clue_numbers(words)
+    width, height = cols * cell_size, rows * cell_size
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="sans-serif">',
+        f'<rect width="{width}" height="{height}" fill="black"/>',
+    ]
+    letter_size = cell_size * 0.55
+    number_size = cell_size * 0.3
     for r in range(rows):
         for c in range(cols):
-            if grid[r][c] == "#":
-                ax.add_patch(plt.Rectangle((c, rows - 1 - r), 1, 1, facecolor="black"))
-            else:
-                ax.add_patch(
-                    plt.Rectangle(
-                        (c, rows - 1 - r), 1, 1, facecolor="white", edgecolor="black"
-                    )
+            cell = grid[r][c]
+            if cell == "#":
+                continue
+            x, y = c * cell_size, r * cell_size
+            parts.append(
+                f'<rect x="{x}" y="{y}" width="{cell_size}" height="{cell_size}" '
+                f'fill="white" stroke="black"/>'
+            )
+            if (r, c) in numbers:
+                parts.append(
+                    f'<text x="{x + cell_size * 0.08}" y="{y + number_size}" '
+                    f'font-size="{number_size}">{numbers[r, c]}</text>'
                 )
-                ax.text(
+            if cell.strip():
+                parts.append(
+                    f'<text x="{x + cell_size / 2}" y="{y + cell_size / 2}" '
+                    f'font-size="{letter_size}" text-anchor="middle" '
+                    f'dominant-baseline="central">{escape(cell)}</text>'
+                )
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
+
+
+class CrosswordFigure:
+    """Matplotlib drawing of a grid whose artists are created once.
+
+    ``update`` re-letters the grid in place and returns the text artists
+    that changed.
+    """
+
+    def __init__(self, grid, words=(), figsize=(8, 8), interactive=False):
+        from matplotlib.collections import PatchCollection
+        from matplotlib.patches import Rectangle
+
+        if interactive:
+            import matplotlib.pyplot as plt
+
+            self.figure, self.ax = plt.subplots(1, 1, figsize=figsize)
+        else:
+            # A bare Figure renders with Agg and never touches a GUI backend.
+            from matplotlib.figure import Figure
+
+            self.figure = Figure(figsize=figsize)
+            self.ax = self.figure.subplots(1, 1)
+
+        ax = self.ax
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_frame_on(False)
+
+        rows, cols = len(grid), len(grid[0])
+        self.rows = rows
+        blocks, cells = [], []
+        self.texts = {}
+        for r in range(rows):
+            for c in range(cols):
+                if grid[r][c] == "#":
+                    blocks.append(Rectangle((c, rows - 1 - r), 1, 1))
+                    continue
+                cells.append(Rectangle((c, rows - 1 - r), 1, 1))
+                self.texts[r, c] = ax.text(
                     c + 0.5,
                     rows - 1 - r + 0.5,
                     grid[r][c],
@@ -29,103 +124,186 @@ def display_crossword(grid, words):
                     va="center",
                     fontsize=12,
                 )
+        ax.add_collection(PatchCollection(blocks, facecolor="black", edgecolor="black"))
+        ax.add_collection(PatchCollection(cells, facecolor="white", edgecolor="black"))
 
-    clue_numbers = {}
-    clue_counter = 1
-    sorted_words = sorted(words, key=lambda x: (x["row"], x["col"]))
-    for word_info in sorted_words:
-        r, c = word_info["row"], word_info["col"]
-        if (r, c) not in clue_numbers:
-            clue_numbers[(r, c)] = clue_counter
+        for (r, c), number in clue_numbers(words).items():
             ax.text(
                 c + 0.1,
                 rows - 1 - r + 0.9,
-                str(clue_counter),
+                str(number),
                 ha="left",
                 va="top",
                 fontsize=8,
             )
-            clue_counter += 1
 
-    ax.set_xlim(0, cols)
-    ax.set_ylim(0, rows)
-    ax.set_aspect("equal")
+        ax.set_xlim(0, cols)
+        ax.set_ylim(0, rows)
+        ax.set_aspect("equal")
+        self.figure.tight_layout()
+
+    def update(self, grid):
+        changed = []
+        for (r, c), text in self.texts.items():
+            if text.get_text() != grid[r][c]:
+                text.set_text(grid[r][c])
+                changed.append(text)
+        return changed
+
+    def save(self, output):
+        self.figure.savefig(output)
+
+    def start_blitting(self):
+        """Render the static background once for ``blit`` (headless only)."""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.transforms import Bbox
+
+        self.canvas = FigureCanvasAgg(self.figure)
+        for text in self.texts.values():
+            text.set_animated(True)
+        self.canvas.draw()
+
+        # One saved region per cell; a changed letter restores just its cell.
+        self.backgrounds = {}
+        for r, c in self.texts:
+            cell = self.ax.transData.transform(
+                [(c, self.rows - 1 - r), (c + 1, self.rows - r)])
+            self.backgrounds[r, c] = self.canvas.copy_from_bbox(Bbox(cell).padded(-1))
+        for text in self.texts.values():
+            self.ax.draw_artist(text)
+
+    def blit(self, grid):
+        """Re-letter the grid, redrawing only the cells that changed."""
+        for (r, c), text in self.texts.items():
+            if text.get_text() != grid[r][c]:
+                text.set_text(grid[r][c])
+                self.canvas.restore_region(self.backgrounds[r, c])
+                self.ax.draw_artist(text)
+
+    def frame(self):
+        return self.canvas.buffer_rgba()
+
+
+def display_crossword(grid, words, output=None):
+    if output is not None and Path(output).suffix.lower() in TEXT_FORMATS:
+        text = render_svg(grid, words) if Path(output).suffix.lower() == ".svg" else render_text(grid)
+        Path(output).write_text(text, encoding="utf-8")
+        return
+
+    drawing = CrosswordFigure(grid, words, interactive=output is None)
+    if output is not None:
+        drawing.save(output)
+        return
+
+    import matplotlib.pyplot as plt
 
-    plt.tight_layout()
     plt.show()
 
 
-def animate_solution(grid, words, solution_stream):
-    fig, ax = plt.subplots(1, 1, figsize=(8, 8))
-    rows, cols = len(grid), len(grid[0])
+def animate_solution(grid, words, solution_stream, output=None, interval=500):
+    """Animate a stream of assignments, e.g. ``CrosswordSolver.solve()``.
 
-    def update(assignment):
-        ax.clear()
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_frame_on(False)
+    With ``output`` the frames are written to a GIF or MP4 file instead of a
+    window; every assignment in the stream becomes one frame.
+    """
+    if output is not None:
+        suffix = Path(output).suffix.lower()
+        if suffix not in ANIMATION_FORMATS:
+            raise ValueError(
+                f"animations can be saved as {', '.join(ANIMATION_FORMATS)}, not {output}")
 
-        solved_grid = [row[:] for row in grid]
-        for var, word in assignment.items():
-            r, c, direction, length = var
-            for i in range(length):
-                if direction == "across":
-                    solved_grid[r][c + i] = word[i]
-                else:
-                    solved_grid[r + i][c] = word[i]
+        drawing = CrosswordFigure(grid, words)
+        drawing.start_blitting()
+        frames = _blitted_frames(drawing, grid, solution_stream)
+        if suffix == ".gif":
+            _save_gif(frames, drawing.canvas.get_width_height(), output, interval)
+        else:
+            _save_movie(frames, drawing.canvas.get_width_height(), output, interval)
+        return
 
-        for r in range(rows):
-            for c in range(cols):
-                if solved_grid[r][c] == "#":
-                    ax.add_patch(
-                        plt.Rectangle((c, rows - 1 - r), 1, 1, facecolor="black")
-                    )
-                else:
-                    ax.add_patch(
-                        plt.Rectangle(
-                            (c, rows - 1 - r),
-                            1,
-                            1,
-                            facecolor="white",
-                            edgecolor="black",
-                        )
-                    )
-                    ax.text(
-                        c + 0.5,
-                        rows - 1 - r + 0.5,
-                        solved_grid[r][c],
-                        ha="center",
-                        va="center",
-                        fontsize=12,
-                    )
-
-        clue_numbers = {}
-        clue_counter = 1
-        sorted_words = sorted(words, key=lambda x: (x["row"], x["col"]))
-        for word_info in sorted_words:
-            r, c = word_info["row"], word_info["col"]
-            if (r, c) not in clue_numbers:
-                clue_numbers[(r, c)] = clue_counter
-                ax.text(
-                    c + 0.1,
-                    rows - 1 - r + 0.9,
-                    str(clue_counter),
-                    ha="left",
-                    va="top",
-                    fontsize=8,
-                )
-                clue_counter += 1
+    import matplotlib.animation as animation
+    import matplotlib.pyplot as plt
 
-        ax.set_xlim(0, cols)
-        ax.set_ylim(0, rows)
-        ax.set_aspect("equal")
+    drawing = CrosswordFigure(grid, words, interactive=True)
+
+    def start():
+        return list(drawing.texts.values())
+
+    def update(assignment):
+        # FuncAnimation restores the empty background before each blitted
+        # frame, so every letter is redrawn, not just the changed ones.
+        drawing.update(fill_grid(grid, assignment))
+        return list(drawing.texts.values())
 
     ani = animation.FuncAnimation(
-        fig,
+        drawing.figure,
         update,
         frames=solution_stream,
+        init_func=start,
+        blit=True,
         repeat=False,
-        interval=500,
+        interval=interval,
         cache_frame_data=False,
     )
     plt.show()
+
+
+def _blitted_frames(drawing, grid, solution_stream):
+    yield drawing.frame()
+    for assignment in solution_stream:
+        drawing.blit(fill_grid(grid, assignment))
+        yield drawing.frame()
+
+
+def _save_gif(frames, size, output, interval):
+    from PIL import GifImagePlugin, Image
+
+    # Frames are encoded and written one at a time; Image.save(append_images=...)
+    # would hold every frame of the solve in memory until the end.
+    with open(output, "wb") as gif:
+        reference = None
+        for frame in frames:
+            image = Image.frombuffer("RGBA", size, bytes(frame)).convert("RGB")
+            if reference is None:
+                # The first frame's palette is the file's global palette; later
+                # frames only add black letters, which it already has.
+                reference = image = image.quantize()
+                header, _ = GifImagePlugin.getheader(image, info={"loop": 0})
+                gif.writelines(header)
+            else:
+                image = image.quantize(palette=reference)
+            gif.writelines(GifImagePlugin.getdata(image, duration=interval))
+        gif.write(b";")
+
+
+def _save_movie(frames, size, output, interval):
+    import subprocess
+
+    from matplotlib import rcParams
+
+    width, height = size
+    command = [
+        rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+        "-r", str(1000 / interval), "-i", "-",
+        # H.264 in yuv420p needs even dimensions.
+        "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+        "-vcodec", "libx264", "-pix_fmt", "yuv420p", str(output),
+    ]
+    try:
+        ffmpeg = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"saving {output} needs ffmpeg; install it or set "
+            "matplotlib.rcParams['animation.ffmpeg_path']") from None
+    try:
+        for frame in frames:
+            ffmpeg.stdin.write(frame)
+    except BrokenPipeError:
+        pass
+    finally:
+        ffmpeg.stdin.close()
+        messages = ffmpeg.stderr.read()
+        ffmpeg.stderr.close()
+    if ffmpeg.wait() != 0:
+        raise RuntimeError(f"ffmpeg failed to write {output}: {messages.decode(errors='replace')}")
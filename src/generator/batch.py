@@ -0,0 +1,111 @@
+"""Bulk puzzle generation across a process pool.
+
+Each spec is (size, num_words, seed); the generator's per-instance RNG makes
+a spec reproduce the same puzzle in any process. Results stream back in
+completion order as compact, JSON-serialisable dicts:
+
+    {"index": 0, "size": 15, "num_words": 30, "seed": 7,
+     "grid": ["###cat#...", ...],
+     "words": [["cat", 0, 3, "across"], ...]}
+
+Command line, one JSON object per line on stdout:
+
+    python -m src.generator.batch --size 15 --words 30 --count 1000 > puzzles.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from src.dictionary.word_loader import get_dictionary
+from src.generator.generator import CrosswordGenerator
+
+
+class PuzzleSpec(NamedTuple):
+    size: int
+    num_words: int
+    seed: int
+
+
+_worker_dictionary = None
+
+
+def generate_puzzle(spec: PuzzleSpec, dictionary=None) -> dict:
+    size, num_words, seed = spec
+    generator = CrosswordGenerator(size=size, dictionary=dictionary, seed=seed)
+    grid, words = generator.generate(num_words=num_words)
+    return {
+        "size": size,
+        "num_words": num_words,
+        "seed": seed,
+        "grid": ["".join(row) for row in grid],
+        "words": [
+            [info["word"], info["row"], info["col"], info["direction"]] for info in words
+        ],
+    }
+
+
+def _init_worker(word_file):
+    global _worker_dictionary
+    # Built once per worker; compiled word lists are memory-mapped and shared.
+    _worker_dictionary = get_dictionary(word_file)
+
+
+def _generate_indexed(index: int, spec: PuzzleSpec) -> dict:
+    return {"index": index, **generate_puzzle(spec, _worker_dictionary)}
+
+
+def generate_batch(
+    specs: Iterable[PuzzleSpec],
+    workers: Optional[int] = None,
+    word_file=None,
+    max_pending: Optional[int] = None,
+) -> Iterator[dict]:
+    """Generate every spec in a process pool, yielding puzzles as they finish.
+
+    ``specs`` may be a lazy iterable; at most ``max_pending`` specs are in
+    flight at once, so memory stays bounded for arbitrarily long batches.
+    Each result carries the ``index`` of its spec in the input.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    specs = enumerate(PuzzleSpec(*spec) for spec in specs)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(word_file,)
+    ) as executor:
+        pending = set()
+        for index, spec in specs:
+            pending.add(executor.submit(_generate_indexed, index, spec))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate crossword puzzles in bulk.")
+    parser.add_argument("--size", type=int, default=15)
+    parser.add_argument("--words", type=int, default=30, help="words to place per puzzle")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first puzzle")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--word-file", help="alternate word list or compiled dictionary")
+    args = parser.parse_args(argv)
+
+    specs = (
+        PuzzleSpec(args.size, args.words, seed)
+        for seed in range(args.seed, args.seed + args.count)
+    )
+    for puzzle in generate_batch(specs, workers=args.workers, word_file=args.word_file):
+        sys.stdout.write(json.dumps(puzzle) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,39 @@
+import bisect
 import random
-from src.dictionary.word_loader import load_words
+from src.dictionary.word_loader import get_dictionary
 
 
 class CrosswordGenerator:
-    def __init__(self, size=15):
+    def __init__(self, size=15, dictionary=None, seed=None):
         self.size = size
+        # Per-instance RNG: the same seed always produces the same puzzle
+        self.random = random.Random(seed)
         self.grid = [["" for _ in range(size)] for _ in range(size)]
         self.words = []
-        self.words_by_length = self._get_words_by_length()
-
-    def _get_words_by_length(self):
-        all_words = load_words()
-        words_by_length = {}
-        for word in all_words:
-            length = len(word)
-            if length not in words_by_length:
-                words_by_length[length] = []
-            words_by_length[length].append(word)
-        return words_by_length
+        self.dictionary = dictionary if dictionary is not None else get_dictionary()
+        self.words_by_length = self.dictionary.words_by_length
+        self.word_index = self.dictionary.word_index
+        self.pattern_cache = self.dictionary.pattern_cache
+
+        # Incremental placement state, kept up to date by place_word:
+        # blocked[d][r][c] - empty cell a word in direction d may not fill
+        #                    because it touches a letter sideways
+        # covered[d][r][c] - cell is part of a word placed in direction d
+        # open_slots       - (row, col, direction) letter cells that only one
+        #                    word covers, where a word in `direction` may cross
+        self.blocked = {
+            direction: [[False] * size for _ in range(size)]
+            for direction in ("across", "down")
+        }
+        self.covered = {
+            direction: [[False] * size for _ in range(size)]
+            for direction in ("across", "down")
+        }
+        self.open_slots = []
+        self._open_slot_positions = {}
 
     def generate(self, num_words=30):
-        start_word = random.choice(
-            self.words_by_length.get(
-                self.size, self.words_by_length.get(self.size - 1, [])
-            )
-        )
+        start_word = self.random.choice(self._start_words())
         row = self.size // 2
         col = (self.size - len(start_word)) // 2
         self.place_word(start_word, row, col, "across")
@@ -35,66 +44,21 @@ class CrosswordGenerator:
             if len(self.words) >= num_words:
                 break
 
-            # KEY CHANGE: Randomize which existing word to use for intersection
-            word_info = random.choice(self.words)
-            existing_word = word_info["word"]
-
-            # KEY CHANGE: Randomize the order of letters to try
-            letter_positions = list(enumerate(existing_word))
-            random.shuffle(letter_positions)
-
             word_placed = False
-            for i, letter in letter_positions:
-                if word_placed:
-                    break
-
-                # KEY CHANGE: Randomize word length selection
-                available_lengths = [
-                    length
-                    for length in self.words_by_length.keys()
-                    if self.words_by_length[length]
-                ]
-                random.shuffle(available_lengths)
-
-                for word_len in available_lengths:
-                    if word_placed:
-                        break
-
-                    candidate_words = self.words_by_length[word_len].copy()
-                    random.shuffle(candidate_words)
-
-                    for new_word in candidate_words:
-                        if letter in new_word and new_word not in placed_words:
-                            # KEY CHANGE: Try all possible positions of the letter in new_word
-                            letter_indices = [
-                                idx
-                                for idx, char in enumerate(new_word)
-                                if char == letter
-                            ]
-                            random.shuffle(letter_indices)
-
-                            for j in letter_indices:
-                                if word_info["direction"] == "across":
-                                    new_row = word_info["row"] - j
-                                    new_col = word_info["col"] + i
-                                    new_direction = "down"
-                                else:
-                                    new_row = word_info["row"] + i
-                                    new_col = word_info["col"] - j
-                                    new_direction = "across"
-
-                                if self.can_place_word(
-                                    new_word, new_row, new_col, new_direction
-                                ):
-                                    self.place_word(
-                                        new_word, new_row, new_col, new_direction
-                                    )
-                                    placed_words.add(new_word)
-                                    word_placed = True
-                                    break
-
-                        if word_placed:
-                            break
+            if self.open_slots:
+                slot = self.random.choice(self.open_slots)
+                placement = self._find_crossing_word(slot, placed_words)
+                if placement is None:
+                    # Heuristic: drop the slot for good. It can come back to
+                    # life if a blocked empty cell on its line later gets a
+                    # letter from a crossing word, but re-checking dead slots
+                    # costs more than the rare words it would add.
+                    self._remove_open_slot(slot)
+                else:
+                    word, new_row, new_col = placement
+                    self.place_word(word, new_row, new_col, slot[2])
+                    placed_words.add(word)
+                    word_placed = True
 
             # KEY CHANGE: Add fallback random placement every few attempts
             if not word_placed and attempt % 20 == 19:
@@ -107,35 +71,138 @@ class CrosswordGenerator:
 
         return self.grid, self.words
 
-    def _try_random_placement(self, placed_words, target_words):
-        """Try to place a word randomly when intersection fails"""
-        if len(self.words) >= target_words:
-            return
+    def _start_words(self):
+        """Words for the first, centred word: as long as the grid allows"""
+        for length in (self.size, self.size - 1):
+            if self.words_by_length.get(length):
+                return self.words_by_length[length]
+        # Grids wider than the longest word start with the longest words there are
+        lengths = [length for length, words in self.words_by_length.items()
+                   if length <= self.size and words]
+        if not lengths:
+            raise ValueError(f"the dictionary has no words that fit a {self.size}x{self.size} grid")
+        return self.words_by_length[max(lengths)]
 
-        # Get available words
-        available_words = []
-        for length in self.words_by_length:
-            for word in self.words_by_length[length]:
-                if word not in placed_words:
-                    available_words.append(word)
+    def _find_crossing_word(self, slot, placed_words):
+        """Pick a random unplaced word that legally crosses an open slot.
+
+        Every length and offset of the crossing letter is turned into a
+        pattern from the cells the word would cover, so the index only returns
+        words that fit the grid.
+        """
+        r, c, direction = slot
+        anchor = r if direction == "down" else c
+
+        lengths = [
+            length
+            for length in self.words_by_length.keys()
+            if length <= self.size and self.words_by_length[length]
+        ]
+        self.random.shuffle(lengths)
+
+        for word_len in lengths:
+            offsets = list(range(
+                max(0, anchor - (self.size - word_len)), min(word_len - 1, anchor) + 1))
+            self.random.shuffle(offsets)
+
+            for j in offsets:
+                if direction == "across":
+                    new_row, new_col = r, c - j
+                else:
+                    new_row, new_col = r - j, c
+                pattern = self._line_pattern(new_row, new_col, direction, word_len)
+                if pattern is None:
+                    continue
+
+                words = self.words_by_length[word_len]
+                # The cached id list is shared; _random_order shuffles a copy.
+                word_ids = list(self.pattern_cache.match_ids(word_len, pattern))
+                for word_id in self._random_order(word_ids):
+                    if words[word_id] not in placed_words:
+                        return words[word_id], new_row, new_col
+        return None
+
+    def _line_pattern(self, row, col, direction, length):
+        """Letters a word must have to be placed here, or None if it cannot be"""
+        dr, dc = (0, 1) if direction == "across" else (1, 0)
+        end_row, end_col = row + dr * length, col + dc * length
+        if self._is_letter(row - dr, col - dc) or self._is_letter(end_row, end_col):
+            return None
+
+        blocked = self.blocked[direction]
+        pattern = [""] * length
+        for i in range(length):
+            cell = self.grid[row + dr * i][col + dc * i]
+            if cell:
+                pattern[i] = cell
+            elif blocked[row + dr * i][col + dc * i]:
+                return None
+        return pattern
+
+    def _is_letter(self, row, col):
+        return (
+            0 <= row < self.size
+            and 0 <= col < self.size
+            and self.grid[row][col] not in ("", "#")
+        )
 
-        if not available_words:
+    def _add_open_slot(self, slot):
+        if slot not in self._open_slot_positions:
+            self._open_slot_positions[slot] = len(self.open_slots)
+            self.open_slots.append(slot)
+
+    def _remove_open_slot(self, slot):
+        position = self._open_slot_positions.pop(slot, None)
+        if position is None:
             return
+        last = self.open_slots.pop()
+        if last != slot:
+            self.open_slots[position] = last
+            self._open_slot_positions[last] = position
 
-        random.shuffle(available_words)
+    def _try_random_placement(self, placed_words, target_words):
+        """Try to place a word randomly when intersection fails"""
+        if len(self.words) >= target_words:
+            return
 
-        # Try to place first few words randomly
-        for word in available_words[:5]:
+        # Try to place a few words drawn uniformly from the whole dictionary
+        for word in self._sample_unplaced_words(placed_words, 5):
             for _ in range(10):  # Try 10 random positions per word
-                row = random.randint(0, self.size - 1)
-                col = random.randint(0, self.size - 1)
-                direction = random.choice(["across", "down"])
+                row = self.random.randint(0, self.size - 1)
+                col = self.random.randint(0, self.size - 1)
+                direction = self.random.choice(["across", "down"])
 
                 if self.can_place_word(word, row, col, direction):
                     self.place_word(word, row, col, direction)
                     placed_words.add(word)
                     return
 
+    def _random_order(self, items):
+        """Yield items in random order, shuffling lazily as they are consumed"""
+        for end in range(len(items) - 1, -1, -1):
+            i = self.random.randint(0, end)
+            items[i], items[end] = items[end], items[i]
+            yield items[end]
+
+    def _sample_unplaced_words(self, placed_words, count):
+        lengths = list(self.words_by_length)
+        offsets = []
+        total = 0
+        for length in lengths:
+            offsets.append(total)
+            total += len(self.words_by_length[length])
+
+        sampled = []
+        for _ in range(count * 10):
+            if len(sampled) >= count or total == 0:
+                break
+            index = self.random.randrange(total)
+            bucket = bisect.bisect_right(offsets, index) - 1
+            word = self.words_by_length[lengths[bucket]][index - offsets[bucket]]
+            if word not in placed_words and word not in sampled:
+                sampled.append(word)
+        return sampled
+
     def can_place_word(self, word, row, col, direction):
         if row < 0 or col < 0:
             return False
@@ -143,54 +210,61 @@ class CrosswordGenerator:
         if direction == "across":
             if col + len(word) > self.size:
                 return False
-            for i, letter in enumerate(word):
-                if self.grid[row][col + i] not in ("", letter):
-                    return False
-                # KEY CHANGE: More lenient adjacent cell checking
-                if self.grid[row][col + i] == "":
-                    # Only check direct adjacency conflicts for empty cells
-                    if (row > 0 and self.grid[row - 1][col + i] not in ("", "#")) or (
-                        row < self.size - 1
-                        and self.grid[row + 1][col + i] not in ("", "#")
-                    ):
-                        return False
-            # Check word boundaries
-            if (col > 0 and self.grid[row][col - 1] not in ("", "#")) or (
-                col + len(word) < self.size
-                and self.grid[row][col + len(word)] not in ("", "#")
-            ):
-                return False
+            cells = [(row, col + i) for i in range(len(word))]
         else:
             if row + len(word) > self.size:
                 return False
-            for i, letter in enumerate(word):
-                if self.grid[row + i][col] not in ("", letter):
+            cells = [(row + i, col) for i in range(len(word))]
+
+        # KEY CHANGE: More lenient adjacent cell checking
+        # Empty cells only conflict when they touch a letter sideways,
+        # which place_word has already recorded in `blocked`
+        blocked = self.blocked[direction]
+        for (r, c), letter in zip(cells, word):
+            if self.grid[r][c] == "":
+                if blocked[r][c]:
                     return False
-                # KEY CHANGE: More lenient adjacent cell checking
-                if self.grid[row + i][col] == "":
-                    if (col > 0 and self.grid[row + i][col - 1] not in ("", "#")) or (
-                        col < self.size - 1
-                        and self.grid[row + i][col + 1] not in ("", "#")
-                    ):
-                        return False
-            # Check word boundaries
-            if (row > 0 and self.grid[row - 1][col] not in ("", "#")) or (
-                row + len(word) < self.size
-                and self.grid[row + len(word)][col] not in ("", "#")
-            ):
+            elif self.grid[r][c] != letter:
                 return False
 
+        # Check word boundaries
+        dr, dc = (0, 1) if direction == "across" else (1, 0)
+        if self._is_letter(row - dr, col - dc) or self._is_letter(
+            row + dr * len(word), col + dc * len(word)
+        ):
+            return False
+
         return True
 
     def place_word(self, word, row, col, direction):
         self.words.append(
             {"word": word, "row": row, "col": col, "direction": direction}
         )
+        other = "down" if direction == "across" else "across"
         for i, letter in enumerate(word):
             if direction == "across":
-                self.grid[row][col + i] = letter
+                r, c = row, col + i
+            else:
+                r, c = row + i, col
+            was_empty = self.grid[r][c] == ""
+            self.grid[r][c] = letter
+
+            self.covered[direction][r][c] = True
+            if self.covered[other][r][c]:
+                self._remove_open_slot((r, c, direction))
             else:
-                self.grid[row + i][col] = letter
+                self._add_open_slot((r, c, other))
+
+            if was_empty:
+                # Neighbours now touch a letter from the side
+                for nr, nc, blocked in (
+                    (r - 1, c, self.blocked["across"]),
+                    (r + 1, c, self.blocked["across"]),
+                    (r, c - 1, self.blocked["down"]),
+                    (r, c + 1, self.blocked["down"]),
+                ):
+                    if 0 <= nr < self.size and 0 <= nc < self.size:
+                        blocked[nr][nc] = True
 
     def print_grid(self):
         for row in self.grid:
@@ -0,0 +1,279 @@
+"""HTTP service for generating and solving crosswords.
+
+    uvicorn src.service.app:app
+
+Solves and generations run in a warm process pool (see ``WorkerPool``), so
+the event loop only awaits futures. Settings come from the environment:
+
+    CROSSWORD_WORKERS        worker processes (default: CPU count)
+    CROSSWORD_MAX_QUEUE      requests allowed to wait for a worker (default: 4 per worker)
+    CROSSWORD_TIME_LIMIT     default and maximum solve time in seconds (default: 10)
+    CROSSWORD_WORD_FILE      alternate word list or compiled dictionary
+    CROSSWORD_STREAM_FPS     default frame rate of streamed solves (default: 10)
+    CROSSWORD_CACHE_SIZE     solved puzzles each worker keeps in memory (default: 1024)
+    CROSSWORD_CACHE_FILE     SQLite file that persists solved puzzles across restarts
+
+Solve progress streams as Server-Sent Events from ``POST /solve-stream`` or
+as JSON messages on the ``/solve-ws`` WebSocket (send the request first).
+Both carry the same messages:
+
+    {"type": "start", "variables": 12}
+    {"type": "frame", "cells": [[row, col, letter], ...]}
+    {"type": "done", "status": "solved", "grid": [...], "elapsed": 0.4}
+    {"type": "error", "detail": "request timed out"}
+
+Frames hold only the cells that changed since the previous frame; a client
+that reads slowly gets fewer, larger frames rather than slowing the solver.
+"""
+import asyncio
+import json
+import os
+import random
+from contextlib import asynccontextmanager
+from typing import List, Literal, Optional, Union
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from pydantic import BaseModel, Field, field_validator
+
+from src.service import workers
+from src.solver.batch import parse_grid
+from src.service.pool import PoolOverloaded, WorkerPool
+
+
+WORKERS = int(os.environ.get("CROSSWORD_WORKERS", 0)) or os.cpu_count() or 1
+MAX_QUEUE = int(os.environ.get("CROSSWORD_MAX_QUEUE", WORKERS * 4))
+TIME_LIMIT = float(os.environ.get("CROSSWORD_TIME_LIMIT", 10.0))
+WORD_FILE = os.environ.get("CROSSWORD_WORD_FILE") or None
+STREAM_FPS = float(os.environ.get("CROSSWORD_STREAM_FPS", 10.0))
+CACHE_SIZE = int(os.environ.get("CROSSWORD_CACHE_SIZE", 1024))
+CACHE_FILE = os.environ.get("CROSSWORD_CACHE_FILE") or None
+# Slack on top of a task's own budget before the request gives up on it.
+TIMEOUT_GRACE = 5.0
+MAX_BATCH = 100
+
+
+class GridRequest(BaseModel):
+    grid: List[str] = Field(
+        min_length=1, max_length=25,
+        description="rows of the grid: '#' for blocks, ' ', '.' or '_' for empty cells",
+    )
+    time_limit: float = Field(default=TIME_LIMIT, gt=0, le=TIME_LIMIT)
+    inference: Optional[Literal["forward_checking", "ac3"]] = None
+    backjumping: bool = False
+    value_order: Optional[Literal["lcv"]] = None
+
+    @field_validator("grid")
+    @classmethod
+    def normalize_grid(cls, grid):
+        if any(len(row) > 25 for row in grid):
+            raise ValueError("rows may be at most 25 cells long")
+        return ["".join(row) for row in parse_grid(grid)]
+
+
+class SolveRequest(GridRequest):
+    node_limit: Optional[int] = Field(default=None, gt=0)
+
+
+class SolveStreamRequest(GridRequest):
+    fps: float = Field(default=STREAM_FPS, gt=0, le=60)
+
+
+class GenerateRequest(BaseModel):
+    size: int = Field(default=15, ge=3, le=25)
+    num_words: int = Field(default=30, ge=1, le=200)
+    seed: Optional[int] = None
+
+
+class BatchRequest(BaseModel):
+    solve: List[SolveRequest] = Field(default=[], max_length=MAX_BATCH)
+    generate: List[GenerateRequest] = Field(default=[], max_length=MAX_BATCH)
+
+
+def generation_timeout(request: GenerateRequest) -> float:
+    # Generation has no budget of its own; scale the backstop with the grid.
+    return TIMEOUT_GRACE + request.size * request.num_words * 0.05
+
+
+async def run_solve(pool: WorkerPool, request: SolveRequest) -> dict:
+    return await pool.run(
+        workers.solve_grid,
+        request.grid,
+        request.time_limit,
+        request.node_limit,
+        request.inference,
+        request.backjumping,
+        request.value_order,
+        timeout=request.time_limit + TIMEOUT_GRACE,
+    )
+
+
+async def open_stream(pool: WorkerPool, request: SolveStreamRequest):
+    """Start a streamed solve and wait for its first message.
+
+    Waiting here means overload and bad grids surface as an error response
+    before any part of the stream has been sent.
+    """
+    stream = pool.stream(
+        workers.stream_solve,
+        request.grid,
+        request.time_limit,
+        request.inference,
+        request.backjumping,
+        request.value_order,
+        request.fps,
+        timeout=request.time_limit + TIMEOUT_GRACE,
+    )
+    try:
+        first = await stream.__anext__()
+    except BaseException:
+        await stream.aclose()
+        raise
+    return first, stream
+
+
+async def run_generate(pool: WorkerPool, request: GenerateRequest) -> dict:
+    seed = request.seed if request.seed is not None else random.randrange(2 ** 32)
+    return await pool.run(
+        workers.generate,
+        request.size,
+        request.num_words,
+        seed,
+        timeout=generation_timeout(request),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    pool = WorkerPool(
+        WORKERS, MAX_QUEUE, word_file=WORD_FILE, cache_size=CACHE_SIZE, cache_file=CACHE_FILE
+    )
+    await pool.start()
+    app.state.pool = pool
+    try:
+        yield
+    finally:
+        pool.shutdown()
+
+
+app = FastAPI(title="Crossword Solver", lifespan=lifespan)
+
+
+@app.exception_handler(PoolOverloaded)
+async def overloaded(request: Request, exc: PoolOverloaded):
+    return JSONResponse(
+        {"detail": "too many requests in flight"}, status_code=503, headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(asyncio.TimeoutError)
+async def timed_out(request: Request, exc: asyncio.TimeoutError):
+    return JSONResponse({"detail": "request timed out"}, status_code=504)
+
+
+@app.get("/health")
+async def health(request: Request):
+    return request.app.state.pool.stats()
+
+
+@app.post("/solve")
+async def solve(body: SolveRequest, request: Request):
+    return await run_solve(request.app.state.pool, body)
+
+
+@app.post("/solve-stream")
+async def solve_stream(body: SolveStreamRequest, request: Request):
+    first, stream = await open_stream(request.app.state.pool, body)
+
+    async def events():
+        try:
+            yield server_sent_event(first)
+            async for message in stream:
+                yield server_sent_event(message)
+        except asyncio.TimeoutError:
+            yield server_sent_event({"type": "error", "detail": "request timed out"})
+        finally:
+            await stream.aclose()
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
+
+
+def server_sent_event(message: dict) -> str:
+    return f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+
+@app.websocket("/solve-ws")
+async def solve_ws(websocket: WebSocket):
+    await websocket.accept()
+    try:
+        body = SolveStreamRequest.model_validate(await websocket.receive_json())
+        first, stream = await open_stream(websocket.app.state.pool, body)
+    except ValidationError as exc:
+        await websocket.send_json({
+            "type": "error", "detail": exc.errors(include_url=False, include_context=False)
+        })
+        await websocket.close(code=1008)
+        return
+    except ValueError:
+        await websocket.send_json({"type": "error", "detail": "expected a JSON request"})
+        await websocket.close(code=1008)
+        return
+    except PoolOverloaded:
+        await websocket.send_json({"type": "error", "detail": "too many requests in flight"})
+        await websocket.close(code=1013)
+        return
+    except WebSocketDisconnect:
+        return
+
+    try:
+        await websocket.send_json(first)
+        async for message in stream:
+            await websocket.send_json(message)
+    except WebSocketDisconnect:
+        return
+    except asyncio.TimeoutError:
+        await websocket.send_json({"type": "error", "detail": "request timed out"})
+    finally:
+        await stream.aclose()
+    await websocket.close()
+
+
+@app.post("/generate")
+async def generate(body: GenerateRequest, request: Request):
+    try:
+        return await run_generate(request.app.state.pool, body)
+    except ValueError as exc:
+        # The request is valid but the dictionary cannot fill such a grid.
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@app.post("/batch")
+async def batch(body: BatchRequest, request: Request):
+    """Run several solves and generations; failures are reported per item."""
+    pool = request.app.state.pool
+    if len(body.solve) + len(body.generate) > pool.max_queue + pool.workers:
+        raise HTTPException(status_code=413, detail="batch is larger than the queue")
+
+    results = await asyncio.gather(
+        *(run_solve(pool, item) for item in body.solve),
+        *(run_generate(pool, item) for item in body.generate),
+        return_exceptions=True,
+    )
+    results = [item_result(result) for result in results]
+    return {
+        "solve": results[:len(body.solve)],
+        "generate": results[len(body.solve):],
+    }
+
+
+def item_result(result: Union[dict, BaseException]) -> dict:
+    if isinstance(result, PoolOverloaded):
+        return {"error": "too many requests in flight"}
+    if isinstance(result, asyncio.TimeoutError):
+        return {"error": "request timed out"}
+    if isinstance(result, BaseException):
+        return {"error": str(result) or type(result).__name__}
+    return result
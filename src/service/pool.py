@@ -0,0 +1,162 @@
+import asyncio
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.service import workers
+
+
+# Frames a streaming task may have queued before it starts coalescing them.
+STREAM_QUEUE_SIZE = 4
+# How long a worker waits to hand over a message nobody is reading.
+SEND_TIMEOUT = 5.0
+# How often the event loop side re-checks a stream whose worker is silent.
+POLL_INTERVAL = 0.1
+
+
+class PoolOverloaded(Exception):
+    """Raised when the pool's queue is full and a request must be shed."""
+
+
+class Channel:
+    """Bounded message queue from a worker task back to the event loop.
+
+    The worker never blocks on a slow reader for long: ``offer`` drops the
+    message if the queue is full, and ``send`` gives up after SEND_TIMEOUT.
+    The reader sets ``cancel`` when it stops listening.
+    """
+
+    def __init__(self, manager, maxsize: int):
+        self._queue = manager.Queue(maxsize)
+        self._cancel = manager.Event()
+
+    def offer(self, message) -> bool:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            return False
+        return True
+
+    def send(self, message) -> bool:
+        try:
+            self._queue.put(message, timeout=SEND_TIMEOUT)
+        except queue.Full:
+            return False
+        return True
+
+    def receive(self, timeout: float):
+        return self._queue.get(timeout=timeout)
+
+    def drain(self) -> list:
+        """Everything still queued, without waiting for more."""
+        messages = []
+        while True:
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                return messages
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+
+class WorkerPool:
+    """Warm process pool with bounded queueing for CPU-bound requests.
+
+    At most ``workers`` tasks run at once; up to ``max_queue`` more wait for a
+    slot, and anything beyond that is rejected immediately so overload turns
+    into fast errors instead of unbounded latency.
+    """
+
+    def __init__(self, workers: int, max_queue: int, word_file=None, cache_size=0, cache_file=None):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.word_file = word_file
+        self.cache_size = cache_size
+        self.cache_file = cache_file
+        self.waiting = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._slots = asyncio.Semaphore(workers)
+
+    async def start(self):
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=workers.init_worker,
+            initargs=(self.word_file, self.cache_size, self.cache_file),
+        )
+        self._manager = multiprocessing.Manager()
+        # Start every worker (and load its dictionary) before taking traffic.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, workers.ping) for _ in range(self.workers)
+        ))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "max_queue": self.max_queue, "waiting": self.waiting}
+
+    async def _submit(self, function, *args) -> asyncio.Future:
+        if self.waiting >= self.max_queue and self._slots.locked():
+            raise PoolOverloaded()
+
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # A timed-out task keeps its worker busy until it returns, so the
+        # slot is only freed when the process is done with it.
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def run(self, function, *args, timeout: Optional[float] = None):
+        future = await self._submit(function, *args)
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    async def stream(self, function, *args, timeout: Optional[float] = None):
+        """Run ``function(*args, channel)`` in a worker, yielding what it sends.
+
+        The generator ends when the task returns; exceptions raised in the
+        worker are re-raised here. Closing the generator cancels the task.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        channel = await loop.run_in_executor(None, Channel, self._manager, STREAM_QUEUE_SIZE)
+        future = await self._submit(function, *args, channel)
+        try:
+            while True:
+                try:
+                    message = await loop.run_in_executor(None, channel.receive, POLL_INTERVAL)
+                except queue.Empty:
+                    if future.done():
+                        # The task may have sent its last messages after the
+                        # receive above timed out; they are all queued by now.
+                        for message in await loop.run_in_executor(None, channel.drain):
+                            yield message
+                        future.result()
+                        return
+                    if deadline is not None and loop.time() >= deadline:
+                        raise asyncio.TimeoutError()
+                    continue
+                yield message
+        finally:
+            # Not awaited: a cancelled request may not be able to await again.
+            loop.run_in_executor(None, channel.cancel)
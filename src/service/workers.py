@@ -0,0 +1,139 @@
+"""Functions that run inside the service's worker processes."""
+import time
+from typing import List, Optional
+
+from src.dictionary.word_loader import get_dictionary
+from src.generator.batch import PuzzleSpec, generate_puzzle
+from src.solver.backtracking import CrosswordSolver
+from src.solver.batch import solution_record
+from src.solver.budget import SolveStatus
+from src.solver.events import FAILED, SOLVED, GridTracker
+from src.solver.solution_cache import SolutionCache
+
+
+_dictionary = None
+_cache = None
+
+
+def init_worker(word_file=None, cache_size=0, cache_file=None):
+    global _dictionary, _cache
+    _dictionary = get_dictionary(word_file)
+    # Build the lazy index now so the first request does not pay for it.
+    _dictionary.word_index
+    if cache_size or cache_file:
+        _dictionary.version
+        _cache = SolutionCache(max_entries=cache_size, path=cache_file)
+
+
+def ping() -> bool:
+    return _dictionary is not None
+
+
+def solve_grid(
+    grid: List[str],
+    time_limit: float,
+    node_limit: Optional[int] = None,
+    inference: Optional[str] = None,
+    backjumping: bool = False,
+    value_order: Optional[str] = None,
+) -> dict:
+    solver = CrosswordSolver(
+        [list(row) for row in grid],
+        dictionary=_dictionary,
+        inference=inference,
+        backjumping=backjumping,
+        value_order=value_order,
+    )
+    if _cache is not None:
+        result = _cache.solve_bounded(solver, time_limit=time_limit, node_limit=node_limit)
+    else:
+        result = solver.solve_bounded(time_limit=time_limit, node_limit=node_limit)
+    return solution_record(solver, result)
+
+
+def stream_solve(
+    grid: List[str],
+    time_limit: float,
+    inference: Optional[str],
+    backjumping: bool,
+    value_order: Optional[str],
+    fps: float,
+    channel,
+) -> None:
+    """Solve ``grid``, sending the cells changed since the last frame at most
+    ``fps`` times a second, then a final message with the status and grid.
+
+    A frame the reader is not ready for is not waited on: its cells stay
+    pending and go out, merged with later changes, in the next frame.
+    """
+    solver = CrosswordSolver(
+        [list(row) for row in grid],
+        dictionary=_dictionary,
+        inference=inference,
+        backjumping=backjumping,
+        value_order=value_order,
+    )
+    tracker = GridTracker(solver.grid)
+    sent = [row[:] for row in solver.grid]
+    dirty = {}
+    interval = 1.0 / fps
+    status = SolveStatus.UNSATISFIABLE
+    if not channel.send({"type": "start", "variables": len(solver.variables)}):
+        return
+
+    start = time.monotonic()
+    deadline = start + time_limit
+    last_frame = start
+    events = solver.solve_events()
+    try:
+        for event in events:
+            if event.kind == SOLVED:
+                status = SolveStatus.SOLVED
+                break
+            if event.kind == FAILED:
+                break
+            for r, c, letter in tracker.apply(event):
+                dirty[r, c] = letter
+
+            now = time.monotonic()
+            if now >= deadline:
+                status = SolveStatus.TIME_LIMIT
+                break
+            if now - last_frame < interval:
+                continue
+            last_frame = now
+            if channel.cancelled:
+                status = SolveStatus.CANCELLED
+                break
+            cells = [[r, c, letter] for (r, c), letter in dirty.items() if sent[r][c] != letter]
+            if cells and channel.offer({"type": "frame", "cells": cells}):
+                _flush_cells(dirty, sent)
+    finally:
+        events.close()
+
+    if status == SolveStatus.CANCELLED:
+        return
+    cells = _flush_cells(dirty, sent)
+    if cells:
+        channel.send({"type": "frame", "cells": cells})
+    channel.send({
+        "type": "done",
+        "status": status.value,
+        "grid": ["".join(row) for row in tracker.grid],
+        "elapsed": time.monotonic() - start,
+    })
+
+
+def _flush_cells(dirty, sent) -> list:
+    """Cells in ``dirty`` that differ from what was last sent, marked as sent."""
+    cells = []
+    for (r, c), letter in dirty.items():
+        if sent[r][c] != letter:
+            sent[r][c] = letter
+            cells.append([r, c, letter])
+    dirty.clear()
+    return cells
+
+
+def generate(size: int, num_words: int, seed: int) -> dict:
+    return generate_puzzle(PuzzleSpec(size, num_words, seed), _dictionary)
@@ -1,9 +1,52 @@
-from src.dictionary.word_loader import load_words
-from typing import List, Dict, Set
+import time
+
+from src.dictionary.dictionary import Dictionary
+from src.dictionary.word_index import mask_to_ids
+from src.dictionary.word_loader import get_dictionary
+from src.solver.events import assignment_events
+from src.solver.budget import CancellationToken, SolveResult, SolveStatus
+from src.solver.instrumentation import SearchInstrumentation
+from src.solver.nogoods import NogoodStore
+from src.solver.state import FOREIGN_WORD, UNASSIGNED, SearchState
+from src.solver.value_ordering import shared_value_ordering
+from typing import List, Dict, Optional
+
+
+# None re-derives candidates from the grid at every node; the other modes
+# keep live per-variable domains and prune them when a word is assigned.
+INFERENCE_MODES = (None, "forward_checking", "ac3")
+# Pattern matching engine behind select_unassigned_variable and
+# order_domain_values: positional bitsets behind the dictionary's shared
+# PatternCache, or numpy arrays (needs numpy).
+BACKENDS = ("bitset", "numpy")
+# Order of the candidate words tried for a slot: dictionary order, or
+# least-constraining value first (see LeastConstrainingValue).
+VALUE_ORDERS = (None, "lcv")
 
 
 class CrosswordSolver:
-    def __init__(self, grid: List[List[str]]):
+    def __init__(
+        self,
+        grid: List[List[str]],
+        dictionary: Optional[Dictionary] = None,
+        inference: Optional[str] = None,
+        backjumping: bool = False,
+        backend: str = "bitset",
+        value_order: Optional[str] = None,
+    ):
+        if inference not in INFERENCE_MODES:
+            raise ValueError(
+                f"inference must be one of {INFERENCE_MODES}, got {inference!r}")
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        if value_order not in VALUE_ORDERS:
+            raise ValueError(
+                f"value_order must be one of {VALUE_ORDERS}, got {value_order!r}")
+        self.inference = inference
+        self.backjumping = backjumping
+        self.backend = backend
+        self.value_order = value_order
+
         self.grid = [["#" if cell == "█" else cell for cell in row]
                      for row in grid]
 
@@ -17,61 +60,44 @@ class CrosswordSolver:
         self.grid = [row + ["#"] * (self.width - len(row))
                      for row in self.grid]
 
-        self.words_by_length = self._get_words_by_length()
+        self.dictionary = dictionary if dictionary is not None else get_dictionary()
+        self.words_by_length = self.dictionary.words_by_length
+        self.word_index = self.dictionary.word_index
+        if backend == "numpy":
+            self.pattern_index = self.dictionary.numpy_index
+        else:
+            self.pattern_index = self.dictionary.pattern_cache
+        self.value_ordering = None
+        if value_order == "lcv":
+            self.value_ordering = shared_value_ordering(self.dictionary)
         self.variables = self._find_variables()
+        self.var_index = {var: index for index, var in enumerate(self.variables)}
+        self.crossings = self._find_crossings()
+        self.base_patterns = [
+            [self.grid[r][c] if self.grid[r][c] != " " else "" for r, c in cells]
+            for cells in self.slot_cells
+        ]
+        self.lengths = [var[3] for var in self.variables]
+        self.slots_by_length: Dict[int, List[int]] = {}
+        for index, length in enumerate(self.lengths):
+            self.slots_by_length.setdefault(length, []).append(index)
+        self.crossing_offsets = [
+            {other: (offset, other_offset) for other, offset, other_offset in slot_crossings}
+            for slot_crossings in self.crossings
+        ]
         self.intersections = self._find_intersections()
         self.variable_intersections = self._get_variable_intersections()
 
-    def _find_intersections(self) -> Dict[tuple, tuple]:
-        intersections = {}
-        for i in range(len(self.variables)):
-            for j in range(i + 1, len(self.variables)):
-                var1 = self.variables[i]
-                var2 = self.variables[j]
-
-                _, _, dir1, _ = var1
-                _, _, dir2, _ = var2
-
-                if dir1 == dir2:
-                    continue
-
-                if dir1 == "down":
-                    across_var, down_var = var2, var1
-                else:
-                    across_var, down_var = var1, var2
-
-                r_across, c_across, _, len_across = across_var
-                r_down, c_down, _, len_down = down_var
-
-                if (
-                    c_across <= c_down < c_across + len_across
-                    and r_down <= r_across < r_down + len_down
-                ):
-                    idx_across = c_down - c_across
-                    idx_down = r_across - r_down
-                    intersections[(across_var, down_var)] = (
-                        idx_across, idx_down)
-        return intersections
-
-    def _get_variable_intersections(self) -> Dict[tuple, List[tuple]]:
-        variable_intersections = {var: [] for var in self.variables}
-        for var1, var2 in self.intersections:
-            variable_intersections[var1].append(var2)
-            variable_intersections[var2].append(var1)
-        return variable_intersections
-
-    def _get_words_by_length(self) -> Dict[int, List[str]]:
-        all_words = load_words()
-        words_by_length = {}
-        for word in all_words:
-            length = len(word)
-            if length not in words_by_length:
-                words_by_length[length] = []
-            words_by_length[length].append(word)
-        return words_by_length
-
     def _find_variables(self) -> List[tuple]:
+        """Find every slot in one row-major pass over the grid.
+
+        Also records, per slot index, the cells it covers (``slot_cells``) and,
+        per white cell, ``cell_slots[r][c] = [across, offset, down, offset]``
+        with None where no slot of that direction passes through the cell.
+        """
         variables = []
+        self.slot_cells = []
+        self.cell_slots = [[None] * self.width for _ in range(self.height)]
         for r in range(self.height):
             for c in range(self.width):
                 if self.grid[r][c] == "#":
@@ -81,129 +107,596 @@ class CrosswordSolver:
                     c == 0 or (c > 0 and self.grid[r][c - 1] == "#")
                 ) and (c + 1 < self.width and self.grid[r][c + 1] != "#")
                 if is_horizontal_start:
-                    length = 0
+                    cells = []
                     temp_c = c
                     while temp_c < self.width and self.grid[r][temp_c] != "#":
-                        length += 1
+                        cells.append((r, temp_c))
                         temp_c += 1
-                    if length > 1:
-                        variables.append((r, c, "across", length))
+                    self._add_slot(variables, (r, c, "across", len(cells)), cells, 0)
 
                 is_vertical_start = (
                     r == 0 or (r > 0 and self.grid[r - 1][c] == "#")
                 ) and (r + 1 < self.height and self.grid[r + 1][c] != "#")
                 if is_vertical_start:
-                    length = 0
+                    cells = []
                     temp_r = r
                     while temp_r < self.height and self.grid[temp_r][c] != "#":
-                        length += 1
+                        cells.append((temp_r, c))
                         temp_r += 1
-                    if length > 1:
-                        variables.append((r, c, "down", length))
+                    self._add_slot(variables, (r, c, "down", len(cells)), cells, 2)
         return variables
 
-    def solve(self):
-        yield from self.backtrack({}, set())
+    def _add_slot(self, variables: List[tuple], var: tuple, cells: List[tuple], field: int):
+        index = len(variables)
+        variables.append(var)
+        self.slot_cells.append(tuple(cells))
+        for offset, (r, c) in enumerate(cells):
+            slots = self.cell_slots[r][c]
+            if slots is None:
+                slots = self.cell_slots[r][c] = [None, None, None, None]
+            slots[field] = index
+            slots[field + 1] = offset
+
+    def _find_crossings(self) -> List[List[tuple]]:
+        """Per slot index, the (other slot, offset here, offset there) crossings.
+
+        Each list is sorted by the other slot's index.
+        """
+        crossings = [[] for _ in self.variables]
+        for row in self.cell_slots:
+            for slots in row:
+                if slots is None or slots[0] is None or slots[2] is None:
+                    continue
+                across, across_offset, down, down_offset = slots
+                crossings[across].append((down, across_offset, down_offset))
+                crossings[down].append((across, down_offset, across_offset))
+        for slot_crossings in crossings:
+            slot_crossings.sort()
+        return crossings
+
+    def _find_intersections(self) -> Dict[tuple, tuple]:
+        """(across var, down var) -> (offset in across, offset in down)."""
+        pairs = []
+        for index, slot_crossings in enumerate(self.crossings):
+            var = self.variables[index]
+            if var[2] != "across":
+                continue
+            for other, offset, other_offset in slot_crossings:
+                pairs.append((min(index, other), max(index, other), var,
+                              self.variables[other], offset, other_offset))
+        pairs.sort(key=lambda pair: pair[:2])
+        return {
+            (across_var, down_var): (idx_across, idx_down)
+            for _, _, across_var, down_var, idx_across, idx_down in pairs
+        }
+
+    def _get_variable_intersections(self) -> Dict[tuple, List[tuple]]:
+        return {
+            var: [self.variables[other] for other, _, _ in self.crossings[index]]
+            for index, var in enumerate(self.variables)
+        }
+
+    def instrument(self, trace_file: Optional[str] = None) -> SearchInstrumentation:
+        """Start collecting search statistics; see ``SearchInstrumentation``."""
+        return SearchInstrumentation(trace_file).attach(self)
+
+    def solve(self, initial_assignment: Optional[Dict[tuple, str]] = None):
+        """Yield the assignment at every search node.
+
+        ``initial_assignment`` fixes some variables up front, with words that
+        need not be in the dictionary (see ``check_initial_assignment``); the
+        search only fills in the rest. The same dict is yielded every time and
+        changed in place between nodes, in stack order.
+        """
+        self.check_initial_assignment(initial_assignment)
+        nogoods = NogoodStore() if self.backjumping else None
+        if self.inference is None:
+            state = self.new_state(initial_assignment)
+            if self.backjumping:
+                yield from self.backjump(state, nogoods)
+            else:
+                yield from self.backtrack(state)
+            return
+
+        state = SearchState(self)
+        domains = self.initial_domains()
+        trail = []
+        culprits = None
+        if self.backjumping:
+            culprits = [frozenset()] * len(self.variables)
+        if not self.assign_initial(state, initial_assignment or {}, domains, trail, culprits):
+            yield dict(initial_assignment or {})
+            return
+        if self.backjumping:
+            yield from self.backjump_with_inference(state, domains, trail, culprits, nogoods)
+        else:
+            yield from self.backtrack_with_inference(state, domains, trail)
+
+    def solve_events(
+        self,
+        sample_every: int = 1,
+        min_interval: Optional[float] = None,
+        initial_assignment: Optional[Dict[tuple, str]] = None,
+    ):
+        """Yield the search as assign/unassign deltas, then solved or failed."""
+        return assignment_events(
+            self.solve(initial_assignment), len(self.variables), sample_every, min_interval)
+
+    def solve_bounded(
+        self,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        initial_assignment: Optional[Dict[tuple, str]] = None,
+    ) -> SolveResult:
+        """Run the search until it finishes or a budget runs out.
+
+        ``time_limit`` is in seconds of wall-clock time and ``node_limit``
+        counts search nodes, i.e. assignments yielded by ``solve()``.
+        """
+        start = time.monotonic()
+        deadline = start + time_limit if time_limit is not None else None
+        best = {}
+        nodes = 0
+        status = SolveStatus.UNSATISFIABLE
+
+        search = self.solve(initial_assignment)
+        try:
+            for assignment in search:
+                nodes += 1
+                if len(assignment) > len(best):
+                    best = dict(assignment)
+                if len(assignment) == len(self.variables):
+                    status = SolveStatus.SOLVED
+                    break
+                if node_limit is not None and nodes >= node_limit:
+                    status = SolveStatus.NODE_LIMIT
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    status = SolveStatus.TIME_LIMIT
+                    break
+                if cancel_token is not None and cancel_token.cancelled:
+                    status = SolveStatus.CANCELLED
+                    break
+        finally:
+            search.close()
+
+        return SolveResult(status, best, nodes, time.monotonic() - start)
+
+    def check_initial_assignment(self, assignment: Optional[Dict[tuple, str]]):
+        """Raise ValueError for initial words that cannot all be placed.
+
+        Words need not be in the dictionary, but each must fill a slot of its
+        length, agree with the grid's letters and the crossing initial words,
+        and be placed only once. Every search mode then starts from the same
+        fixed letters.
+        """
+        letters = {}
+        slots = {}
+        for var, word in (assignment or {}).items():
+            if var not in self.var_index:
+                raise ValueError(f"{var} is not a slot of this grid")
+            if len(word) != var[3]:
+                raise ValueError(f"{word!r} does not fit slot {var} of length {var[3]}")
+            if word in slots:
+                raise ValueError(f"{word!r} is placed in both {slots[word]} and {var}")
+            slots[word] = var
+            for (r, c), letter in zip(self.slot_cells[self.var_index[var]], word):
+                cell = letters.get((r, c), self.grid[r][c])
+                if cell not in (" ", letter):
+                    raise ValueError(
+                        f"{word!r} in slot {var} needs {letter!r} at ({r}, {c}), "
+                        f"which holds {cell!r}")
+                letters[r, c] = letter
+
+    def new_state(self, assignment: Optional[Dict[tuple, str]] = None) -> SearchState:
+        """A search state holding ``assignment``, in its order.
+
+        Words that are not in the dictionary are kept as FOREIGN_WORD: they
+        fill in crossing letters but use up no dictionary word.
+        """
+        self.check_initial_assignment(assignment)
+        state = SearchState(self)
+        for var, word in (assignment or {}).items():
+            word_id = self.word_index.word_id(word)
+            if word_id is None:
+                word_id = FOREIGN_WORD
+            state.assign(self.var_index[var], word_id, word)
+        return state
+
+    def assign_initial(
+        self,
+        state: SearchState,
+        assignment: Dict[tuple, str],
+        domains: List[int],
+        trail: List[tuple],
+        culprits: Optional[List[frozenset]] = None,
+    ) -> bool:
+        # Words outside the dictionary only fix letters, as in new_state; they
+        # go first so that AC-3 sees their letters rather than their domains.
+        dictionary_words = []
+        for var, word in assignment.items():
+            index = self.var_index[var]
+            word_id = self.word_index.word_id(word)
+            if word_id is None:
+                state.assign(index, FOREIGN_WORD, word)
+                if not self.propagate_letters(index, word, state, domains, trail, culprits):
+                    return False
+            else:
+                dictionary_words.append((index, word_id, word))
+
+        if self.inference == "ac3" and not self.ac3(domains, state, trail, culprits=culprits):
+            return False
+
+        for index, word_id, word in dictionary_words:
+            if not domains[index] >> word_id & 1:
+                return False
+            state.assign(index, word_id, word)
+            if not self.propagate(index, word_id, state, domains, trail, culprits):
+                return False
+        return True
 
-    def backtrack(self, assignment: Dict[tuple, str], used_words: Set[str]):
-        yield assignment
+    def backtrack(self, state: SearchState):
+        yield state.assignment
 
-        if len(assignment) == len(self.variables):
+        if len(state) == len(self.variables):
             return
 
-        var = self.select_unassigned_variable(assignment)
+        var = self.select_unassigned_variable(state)
         if var is None:
             return
 
-        for word in self.order_domain_values(var, assignment):
-            if self.is_consistent(word, used_words):
-                assignment[var] = word
-                used_words.add(word)
-                yield from self.backtrack(assignment, used_words)
-                if len(assignment) == len(self.variables):
+        words = self.words_by_length.get(self.lengths[var], ())
+        for word_id in self.order_domain_values(var, state):
+            if self.is_consistent(var, word_id, state):
+                state.assign(var, word_id, words[word_id])
+                yield from self.backtrack(state)
+                if len(state) == len(self.variables):
                     return
-                del assignment[var]
-                used_words.remove(word)
+                state.unassign(var)
 
-    def get_pattern(self, var: tuple, assignment: Dict[tuple, str]) -> List[str]:
-        r, c, direction, length = var
-        pattern = [""] * length
+    def backtrack_with_inference(
+        self,
+        state: SearchState,
+        domains: List[int],
+        trail: List[tuple],
+    ):
+        yield state.assignment
 
-        for i in range(length):
-            current_r, current_c = r, c
-            if direction == "across":
-                current_c += i
-            else:
-                current_r += i
+        if len(state) == len(self.variables):
+            return
 
-            if (
-                self.grid[current_r][current_c] != " "
-                and self.grid[current_r][current_c] != "#"
-            ):
-                pattern[i] = self.grid[current_r][current_c]
-
-        for other_var in self.variable_intersections[var]:
-            if other_var in assignment:
-                intersection = self.intersections.get((var, other_var))
-                if not intersection:
-                    intersection = self.intersections.get((other_var, var))
-                    idx_in_var = intersection[1]
-                    idx_in_other_var = intersection[0]
-                else:
-                    idx_in_var = intersection[0]
-                    idx_in_other_var = intersection[1]
+        var = self.select_variable_by_domain(state, domains)
+        words = self.words_by_length.get(self.lengths[var], ())
 
-                pattern[idx_in_var] = assignment[other_var][idx_in_other_var]
-        return pattern
+        for word_id in self.domain_values(var, state, domains):
+            mark = len(trail)
+            state.assign(var, word_id, words[word_id])
+            if self.propagate(var, word_id, state, domains, trail):
+                yield from self.backtrack_with_inference(state, domains, trail)
+                if len(state) == len(self.variables):
+                    return
+            self.undo_trail(domains, trail, mark)
+            state.unassign(var)
 
-    def select_unassigned_variable(self, assignment: Dict[tuple, str]) -> tuple:
-        unassigned_vars = [v for v in self.variables if v not in assignment]
+    def backjump(self, state: SearchState, nogoods: NogoodStore):
+        """Conflict-directed backjumping over the pattern-recomputing search.
 
-        best_var = None
-        min_count = float("inf")
+        Returns the conflict set of the subtree: the assigned variables whose
+        values together caused it to fail. A parent that is not part of that
+        set cannot fix the failure, so it returns straight away instead of
+        trying its remaining words.
+        """
+        yield state.assignment
 
-        for var in unassigned_vars:
-            pattern = self.get_pattern(var, assignment)
-            length = var[3]
-
-            count = 0
-            words_to_check = self.words_by_length.get(length, [])
-            for word in words_to_check:
-                match = True
-                for i, char in enumerate(pattern):
-                    if char != "" and char != word[i]:
-                        match = False
-                        break
-                if match:
-                    count += 1
+        if len(state) == len(self.variables):
+            return set()
 
+        var = self.select_unassigned_variable(state)
+        if var is None:
+            return set()
+
+        word_ids = state.word_ids
+        used = state.used[self.lengths[var]]
+        words = self.words_by_length.get(self.lengths[var], ())
+        # The crossing words fix the pattern, so they explain every word it rules out.
+        conflict = {
+            other for other, _, _ in self.crossings[var] if word_ids[other] != UNASSIGNED
+        }
+        for word_id in self.order_domain_values(var, state):
+            if used[word_id] != UNASSIGNED:
+                conflict.add(used[word_id])
+                continue
+
+            nogood = nogoods.find_violated(var, word_id, word_ids)
+            if nogood is not None:
+                conflict |= nogood - {var}
+                continue
+
+            state.assign(var, word_id, words[word_id])
+            child_conflict = yield from self.backjump(state, nogoods)
+            if len(state) == len(self.variables):
+                return set()
+            state.unassign(var)
+
+            if var not in child_conflict:
+                return child_conflict
+            conflict |= child_conflict - {var}
+
+        nogoods.add(word_ids, conflict)
+        return conflict
+
+    def backjump_with_inference(
+        self,
+        state: SearchState,
+        domains: List[int],
+        trail: List[tuple],
+        culprits: List[frozenset],
+        nogoods: NogoodStore,
+    ):
+        """Conflict-directed backjumping on top of forward checking / MAC.
+
+        ``culprits`` holds, per variable, the assigned variables whose
+        propagation pruned its domain; a wiped-out neighbour's culprits are the
+        conflict set of the value that wiped it out.
+        """
+        yield state.assignment
+
+        if len(state) == len(self.variables):
+            return set()
+
+        var = self.select_variable_by_domain(state, domains)
+        words = self.words_by_length.get(self.lengths[var], ())
+
+        conflict = set(culprits[var])
+        for word_id in self.domain_values(var, state, domains):
+            nogood = nogoods.find_violated(var, word_id, state.word_ids)
+            if nogood is not None:
+                conflict |= nogood - {var}
+                continue
+
+            mark = len(trail)
+            state.assign(var, word_id, words[word_id])
+            if not self.propagate(var, word_id, state, domains, trail, culprits):
+                # set_domain records the wipe-out last, so its culprits explain the failure.
+                wiped_var = trail[-1][0]
+                conflict |= culprits[wiped_var] - {var}
+                self.undo_trail(domains, trail, mark, culprits)
+                state.unassign(var)
+                continue
+
+            child_conflict = yield from self.backjump_with_inference(
+                state, domains, trail, culprits, nogoods)
+            if len(state) == len(self.variables):
+                return set()
+            self.undo_trail(domains, trail, mark, culprits)
+            state.unassign(var)
+
+            if var not in child_conflict:
+                return child_conflict
+            conflict |= child_conflict - {var}
+
+        nogoods.add(state.word_ids, conflict)
+        return conflict
+
+    def initial_domains(self) -> List[int]:
+        return [
+            self.word_index.match_mask(length, pattern)
+            for length, pattern in zip(self.lengths, self.base_patterns)
+        ]
+
+    def select_variable_by_domain(self, state: SearchState, domains: List[int]) -> Optional[int]:
+        word_ids = state.word_ids
+        best_var = None
+        min_count = float("inf")
+        for var in range(len(self.variables)):
+            if word_ids[var] != UNASSIGNED:
+                continue
+            count = domains[var].bit_count()
             if count < min_count:
                 min_count = count
                 best_var = var
-
         return best_var
 
-    def order_domain_values(
-        self, var: tuple, assignment: Dict[tuple, str]
-    ) -> List[str]:
-        length = var[3]
-        pattern = self.get_pattern(var, assignment)
-
-        candidate_words = []
-        words_to_check = self.words_by_length.get(length, [])
-        for word in words_to_check:
-            match = True
-            for i, char in enumerate(pattern):
-                if char != "" and char != word[i]:
-                    match = False
+    def propagate(
+        self,
+        var: int,
+        word_id: int,
+        state: SearchState,
+        domains: List[int],
+        trail: List[tuple],
+        culprits: Optional[List[frozenset]] = None,
+    ) -> bool:
+        """Prune unassigned domains after assigning var; False on a wipe-out."""
+        length = self.lengths[var]
+        word_ids = state.word_ids
+        reason = frozenset((var,))
+        self.set_domain(var, 1 << word_id, domains, trail, culprits)
+
+        # Each word may be used once, so drop it from every same-length slot.
+        unused = ~(1 << word_id)
+        for other in self.slots_by_length[length]:
+            if word_ids[other] == UNASSIGNED:
+                if not self.set_domain(
+                    other, domains[other] & unused, domains, trail, culprits, reason
+                ):
+                    return False
+
+        return self.propagate_letters(
+            var, self.words_by_length[length][word_id], state, domains, trail, culprits)
+
+    def propagate_letters(
+        self,
+        var: int,
+        word: str,
+        state: SearchState,
+        domains: List[int],
+        trail: List[tuple],
+        culprits: Optional[List[frozenset]] = None,
+    ) -> bool:
+        """Prune the crossing domains to the letters of var's word."""
+        word_ids = state.word_ids
+        reason = frozenset((var,))
+        changed = []
+        for other, idx_in_var, idx_in_other in self.crossings[var]:
+            if word_ids[other] != UNASSIGNED:
+                continue
+            letter_mask = self.word_index.letter_mask(
+                self.lengths[other], idx_in_other, word[idx_in_var])
+            if not self.set_domain(
+                other, domains[other] & letter_mask, domains, trail, culprits, reason
+            ):
+                return False
+            changed.append(other)
+
+        if self.inference == "ac3":
+            return self.ac3(domains, state, trail, changed, culprits)
+        return True
+
+    def ac3(
+        self,
+        domains: List[int],
+        state: SearchState,
+        trail: List[tuple],
+        changed: Optional[List[int]] = None,
+        culprits: Optional[List[frozenset]] = None,
+    ) -> bool:
+        """Make every crossing between unassigned variables arc consistent.
+
+        With ``changed`` only the arcs pointing at those variables are queued,
+        which is what maintaining arc consistency needs after an assignment.
+        """
+        word_ids = state.word_ids
+        sources = range(len(self.variables)) if changed is None else changed
+        queue = [
+            (other, var)
+            for var in sources
+            for other, _, _ in self.crossings[var]
+            if word_ids[other] == UNASSIGNED
+        ]
+        queued = set(queue)
+
+        while queue:
+            var, other = queue.pop()
+            queued.discard((var, other))
+            old_domain = domains[var]
+            if not self.revise(var, other, state, domains, trail, culprits):
+                return False
+            if domains[var] != old_domain:
+                for neighbour, _, _ in self.crossings[var]:
+                    arc = (neighbour, var)
+                    if (neighbour != other and word_ids[neighbour] == UNASSIGNED
+                            and arc not in queued):
+                        queue.append(arc)
+                        queued.add(arc)
+        return True
+
+    def revise(
+        self,
+        var: int,
+        other: int,
+        state: SearchState,
+        domains: List[int],
+        trail: List[tuple],
+        culprits: Optional[List[frozenset]] = None,
+    ) -> bool:
+        """Keep only words of var whose crossing letter other still allows."""
+        idx_in_var, idx_in_other = self.crossing_offsets[var][other]
+        length = self.lengths[var]
+        if state.word_ids[other] != UNASSIGNED:
+            # An assigned word allows just its own letter, which is also how
+            # an initial word from outside the dictionary constrains var.
+            supported = self.word_index.letter_mask(
+                length, idx_in_var, state.patterns[var][idx_in_var])
+        else:
+            supported = 0
+            for letter in self.word_index.letters_at(
+                self.lengths[other], idx_in_other, domains[other]
+            ):
+                supported |= self.word_index.letter_mask(length, idx_in_var, letter)
+        reason = culprits[other] if culprits is not None else None
+        return self.set_domain(
+            var, domains[var] & supported, domains, trail, culprits, reason)
+
+    def set_domain(
+        self,
+        var: int,
+        domain: int,
+        domains: List[int],
+        trail: List[tuple],
+        culprits: Optional[List[frozenset]] = None,
+        reason: Optional[frozenset] = None,
+    ) -> bool:
+        if domain != domains[var]:
+            if culprits is None:
+                trail.append((var, domains[var], None))
+            else:
+                trail.append((var, domains[var], culprits[var]))
+                if reason:
+                    culprits[var] = culprits[var] | reason
+            domains[var] = domain
+        return domain != 0
+
+    def undo_trail(
+        self,
+        domains: List[int],
+        trail: List[tuple],
+        mark: int,
+        culprits: Optional[List[frozenset]] = None,
+    ):
+        while len(trail) > mark:
+            var, domain, var_culprits = trail.pop()
+            domains[var] = domain
+            if culprits is not None:
+                culprits[var] = var_culprits
+
+    def get_pattern(self, var: int, state: SearchState) -> List[str]:
+        """The slot's current letters; a live view, not to be modified."""
+        return state.patterns[var]
+
+    def select_unassigned_variable(self, state: SearchState) -> Optional[int]:
+        word_ids = state.word_ids
+        best_var = None
+        min_count = float("inf")
+
+        for var in range(len(self.variables)):
+            if word_ids[var] != UNASSIGNED:
+                continue
+            pattern = self.get_pattern(var, state)
+            length = self.lengths[var]
+
+            count = self.pattern_index.count(length, pattern)
+            if count < min_count:
+                min_count = count
+                best_var = var
+                if count == 0:
                     break
-            if match:
-                candidate_words.append(word)
 
-        return candidate_words
+        return best_var
 
-    def is_consistent(self, word: str, used_words: Set[str]) -> bool:
-        return word not in used_words
+    def order_domain_values(self, var: int, state: SearchState) -> List[int]:
+        length = self.lengths[var]
+        pattern = self.get_pattern(var, state)
+
+        return self.rank_values(var, self.pattern_index.match_ids(length, pattern), state)
+
+    def domain_values(self, var: int, state: SearchState, domains: List[int]) -> List[int]:
+        return self.rank_values(var, mask_to_ids(domains[var]), state)
+
+    def rank_values(self, var: int, candidates: List[int], state: SearchState) -> List[int]:
+        if self.value_ordering is None or not candidates:
+            return candidates
+        word_ids = state.word_ids
+        crossings = [
+            (idx_in_var, self.lengths[other], idx_in_other, state.patterns[other])
+            for other, idx_in_var, idx_in_other in self.crossings[var]
+            if word_ids[other] == UNASSIGNED
+        ]
+        return self.value_ordering.order(
+            self.words_by_length.get(self.lengths[var], ()), candidates, crossings)
+
+    def is_consistent(self, var: int, word_id: int, state: SearchState) -> bool:
+        return state.used[self.lengths[var]][word_id] == UNASSIGNED
 
     def get_grid_with_solution(self, assignment: Dict[tuple, str]) -> List[List[str]]:
 
@@ -0,0 +1,201 @@
+"""Bulk solving of puzzle files across a process pool.
+
+Input is JSON Lines, one puzzle per line. A line is either a list of row
+strings or an object with a ``grid`` of row strings and an optional ``id``:
+
+    {"id": "mon-001", "grid": ["###  #", "#     ", ...]}
+
+'#' (or '█') marks a block, ' ', '.' or '_' an empty cell and a letter a
+given letter. Output is one JSON object per line, in input
+order unless ``--unordered`` is given:
+
+    {"index": 0, "id": "mon-001", "status": "solved", "grid": [...],
+     "words": [["cat", 0, 3, "across"], ...], "nodes": 41, "elapsed": 0.002}
+
+Lines that cannot be parsed or solved produce ``{"index": ..., "error": ...}``.
+Input is read lazily and only a bounded number of puzzles is in flight, so
+files of any size are processed in constant memory:
+
+    python -m src.solver.batch puzzles.jsonl --time-limit 5 > solutions.jsonl
+    python -m src.generator.batch --count 100 | python -m src.solver.batch --blank
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional
+
+from src.dictionary.word_loader import get_dictionary
+from src.solver.backtracking import INFERENCE_MODES, VALUE_ORDERS, CrosswordSolver
+from src.solver.budget import SolveResult
+
+
+EMPTY_CELLS = " ._"
+
+_worker_dictionary = None
+_worker_options = None
+
+
+def parse_grid(rows: List[str], blank: bool = False) -> List[List[str]]:
+    """Turn row strings into a solver grid, optionally dropping given letters."""
+    if not isinstance(rows, list) or not rows or not all(isinstance(row, str) for row in rows):
+        raise ValueError("a grid is a non-empty list of row strings")
+    grid = []
+    for row in rows:
+        cells = []
+        for cell in row:
+            if cell in EMPTY_CELLS:
+                cells.append(" ")
+            elif cell in "#█":
+                cells.append("#")
+            elif cell.isalpha():
+                cells.append(" " if blank else cell)
+            else:
+                raise ValueError(f"invalid cell {cell!r}")
+        grid.append(cells)
+    return grid
+
+
+def solution_record(solver: CrosswordSolver, result: SolveResult) -> dict:
+    solved_grid = solver.get_grid_with_solution(result.assignment)
+    return {
+        "status": result.status.value,
+        "grid": ["".join(row) for row in solved_grid],
+        "words": [
+            [word, r, c, direction] for (r, c, direction, _), word in result.assignment.items()
+        ],
+        "nodes": result.nodes,
+        "elapsed": result.elapsed,
+    }
+
+
+def solve_line(index: int, line: str, dictionary=None, blank=False, time_limit=None,
+               node_limit=None, **solver_options) -> dict:
+    record = {"index": index}
+    try:
+        puzzle = json.loads(line)
+        if isinstance(puzzle, dict):
+            if "id" in puzzle:
+                record["id"] = puzzle["id"]
+            puzzle = puzzle.get("grid")
+        grid = parse_grid(puzzle, blank)
+    except ValueError as exc:
+        record["error"] = str(exc)
+        return record
+
+    try:
+        solver = CrosswordSolver(grid, dictionary=dictionary, **solver_options)
+        result = solver.solve_bounded(time_limit=time_limit, node_limit=node_limit)
+        record.update(solution_record(solver, result))
+    except Exception as exc:
+        # One puzzle the solver chokes on must not end a whole batch run.
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+def _init_worker(word_file, options):
+    global _worker_dictionary, _worker_options
+    _worker_dictionary = get_dictionary(word_file)
+    _worker_options = options
+
+
+def _solve_indexed(sequence: int, index: int, line: str):
+    return sequence, solve_line(index, line, _worker_dictionary, **_worker_options)
+
+
+def solve_batch(
+    lines: Iterable[str],
+    workers: Optional[int] = None,
+    word_file=None,
+    max_pending: Optional[int] = None,
+    ordered: bool = True,
+    **options,
+) -> Iterator[dict]:
+    """Solve every non-empty line in a process pool, yielding records.
+
+    Each record's ``index`` is the 0-based line number. At most
+    ``max_pending`` puzzles are queued, running or waiting for an earlier
+    one to be yielded. ``options`` are passed to ``solve_line`` (``blank``,
+    ``time_limit``, ``node_limit`` and the solver's keyword arguments).
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    puzzles = enumerate((index, line) for index, line in enumerate(lines) if line.strip())
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(word_file, options)
+    ) as executor:
+        pending = set()
+        finished = {}
+        next_sequence = 0
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) + len(finished) < max_pending:
+                puzzle = next(puzzles, None)
+                if puzzle is None:
+                    exhausted = True
+                else:
+                    sequence, (index, line) = puzzle
+                    pending.add(executor.submit(_solve_indexed, sequence, index, line))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                sequence, record = future.result()
+                if ordered:
+                    finished[sequence] = record
+                else:
+                    yield record
+            while next_sequence in finished:
+                yield finished.pop(next_sequence)
+                next_sequence += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a JSON Lines file of crossword grids.")
+    parser.add_argument("input", nargs="?", help="puzzle file (default: stdin)")
+    parser.add_argument("-o", "--output", help="write results here (default: stdout)")
+    parser.add_argument("--time-limit", type=float, default=10.0,
+                        help="seconds allowed per puzzle")
+    parser.add_argument("--node-limit", type=int, help="search nodes allowed per puzzle")
+    parser.add_argument("--inference", choices=[mode for mode in INFERENCE_MODES if mode])
+    parser.add_argument("--backjumping", action="store_true")
+    parser.add_argument("--value-order", choices=[order for order in VALUE_ORDERS if order],
+                        help="try least-constraining words first")
+    parser.add_argument("--blank", action="store_true",
+                        help="ignore given letters, e.g. to re-solve generated puzzles")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--unordered", action="store_true",
+                        help="write results as they finish instead of in input order")
+    parser.add_argument("--word-file", help="alternate word list or compiled dictionary")
+    args = parser.parse_args(argv)
+
+    source = open(args.input, encoding="utf-8") if args.input else sys.stdin
+    sink = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        records = solve_batch(
+            source,
+            workers=args.workers,
+            word_file=args.word_file,
+            ordered=not args.unordered,
+            blank=args.blank,
+            time_limit=args.time_limit,
+            node_limit=args.node_limit,
+            inference=args.inference,
+            backjumping=args.backjumping,
+            value_order=args.value_order,
+        )
+        for record in records:
+            sink.write(json.dumps(record) + "\n")
+            sink.flush()
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            sink.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict
+
+
+class SolveStatus(str, Enum):
+    SOLVED = "solved"
+    UNSATISFIABLE = "unsatisfiable"
+    TIME_LIMIT = "time_limit"
+    NODE_LIMIT = "node_limit"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class SolveResult:
+    """Outcome of a bounded solve.
+
+    ``assignment`` is the solution when solved, otherwise the largest
+    partial assignment the search reached before stopping.
+    """
+
+    status: SolveStatus
+    assignment: Dict[tuple, str] = field(default_factory=dict)
+    nodes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def solved(self) -> bool:
+        return self.status == SolveStatus.SOLVED
+
+    @property
+    def budget_exhausted(self) -> bool:
+        return self.status in (SolveStatus.TIME_LIMIT, SolveStatus.NODE_LIMIT)
+
+
+class CancellationToken:
+    """Thread-safe flag a caller sets to stop a running solve."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
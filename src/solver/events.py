@@ -0,0 +1,150 @@
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+ASSIGN = "assign"
+UNASSIGN = "unassign"
+SOLVED = "solved"
+FAILED = "failed"
+
+
+class SolveEvent(NamedTuple):
+    kind: str
+    var: Optional[tuple] = None
+    word: Optional[str] = None
+
+
+def assignment_events(
+    stream: Iterable[Dict[tuple, str]],
+    num_variables: int,
+    sample_every: int = 1,
+    min_interval: Optional[float] = None,
+) -> Iterator[SolveEvent]:
+    """Turn a stream of assignments into assign/unassign deltas.
+
+    The solvers add and remove variables in stack order, so consecutive
+    assignments differ by a few removals of the newest entries followed by
+    one addition, which is found in O(1) from the dict's insertion order.
+    Anything else (a different dict object, several additions) falls back
+    to a full diff. An assign for a variable that already holds a word
+    replaces that word.
+
+    With ``sample_every`` or ``min_interval`` the deltas of skipped nodes are
+    coalesced, so only the net change since the previous batch is emitted.
+    The final state is always flushed before the solved/failed event.
+    """
+    stack: List[Tuple[tuple, str]] = []
+    current = None
+    pending: Dict[tuple, Optional[str]] = {}
+    emitted: Dict[tuple, str] = {}
+    last_emit = time.monotonic()
+    solved = False
+
+    for nodes, assignment in enumerate(stream, 1):
+        if assignment is current:
+            changes = _stack_changes(stack, assignment)
+        else:
+            changes = _full_changes(stack, assignment)
+            current = assignment
+        if changes is None:
+            changes = _full_changes(stack, assignment)
+
+        for var, word in changes:
+            pending[var] = word
+
+        solved = len(assignment) == num_variables
+        if solved:
+            break
+        if nodes % sample_every:
+            continue
+        if min_interval is not None:
+            now = time.monotonic()
+            if now - last_emit < min_interval:
+                continue
+            last_emit = now
+        yield from _flush(pending, emitted)
+
+    yield from _flush(pending, emitted)
+    yield SolveEvent(SOLVED if solved else FAILED)
+
+
+def _stack_changes(stack, assignment):
+    num_pops = len(stack) + 1 - len(assignment)
+    if num_pops < 0 or num_pops > len(stack):
+        return None
+
+    changes = []
+    popped = None
+    for _ in range(num_pops):
+        popped = stack.pop()
+        changes.append((popped[0], None))
+    if assignment:
+        var = next(reversed(assignment))
+        entry = (var, assignment[var])
+        stack.append(entry)
+        if entry == popped:
+            changes.pop()
+        else:
+            changes.append(entry)
+    return changes
+
+
+def _full_changes(stack, assignment):
+    previous = dict(stack)
+    changes = [(var, None) for var in previous if var not in assignment]
+    changes.extend(
+        (var, word) for var, word in assignment.items() if previous.get(var) != word)
+    stack[:] = assignment.items()
+    return changes
+
+
+def _flush(pending, emitted):
+    for var, word in pending.items():
+        if word is None and var in emitted:
+            del emitted[var]
+            yield SolveEvent(UNASSIGN, var)
+    for var, word in pending.items():
+        if word is not None and emitted.get(var) != word:
+            emitted[var] = word
+            yield SolveEvent(ASSIGN, var, word)
+    pending.clear()
+
+
+class GridTracker:
+    """Applies solve events to a grid, touching only the event's cells.
+
+    An assign event for a variable that already holds a word replaces it.
+    """
+
+    def __init__(self, grid: List[List[str]]):
+        self.base = [row[:] for row in grid]
+        self.grid = [row[:] for row in grid]
+        self.assignment: Dict[tuple, str] = {}
+        self._refs = [[0] * len(row) for row in grid]
+
+    @staticmethod
+    def cells(var: tuple) -> List[Tuple[int, int]]:
+        r, c, direction, length = var
+        if direction == "across":
+            return [(r, c + i) for i in range(length)]
+        return [(r + i, c) for i in range(length)]
+
+    def apply(self, event: SolveEvent) -> List[Tuple[int, int, str]]:
+        """Apply one event and return the (row, col, letter) cells it changed."""
+        changed = []
+        if event.kind in (ASSIGN, UNASSIGN) and event.var in self.assignment:
+            del self.assignment[event.var]
+            for r, c in self.cells(event.var):
+                self._refs[r][c] -= 1
+                if self._refs[r][c] == 0 and self.grid[r][c] != self.base[r][c]:
+                    self.grid[r][c] = self.base[r][c]
+                    changed.append((r, c, self.base[r][c]))
+
+        if event.kind == ASSIGN:
+            self.assignment[event.var] = event.word
+            for (r, c), letter in zip(self.cells(event.var), event.word):
+                self._refs[r][c] += 1
+                if self.grid[r][c] != letter:
+                    self.grid[r][c] = letter
+                    changed.append((r, c, letter))
+        return changed
@@ -0,0 +1,185 @@
+import json
+import time
+from functools import wraps
+from typing import Dict, Optional
+
+
+TIMED_METHODS = (
+    "get_pattern",
+    "select_unassigned_variable",
+    "select_variable_by_domain",
+    "order_domain_values",
+)
+PATTERN_METHODS = ("count", "match", "match_ids", "match_mask")
+
+
+class _CountingIndex:
+    """Per-solver proxy that counts pattern queries on a shared index."""
+
+    def __init__(self, index, counter: "SearchInstrumentation"):
+        self._index = index
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._index, name)
+        if name not in PATTERN_METHODS:
+            return attr
+
+        @wraps(attr)
+        def counted(*args, **kwargs):
+            self._counter.pattern_matches += 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+
+class SearchInstrumentation:
+    """Opt-in search statistics for one CrosswordSolver.
+
+    ``attach`` replaces the hot methods on the solver *instance* with
+    counting/timing wrappers, so solvers that are never instrumented run the
+    unmodified methods. Timings are inclusive: ``select_unassigned_variable``
+    includes the ``get_pattern`` calls it makes.
+    """
+
+    def __init__(self, trace_file=None):
+        self.trace_file = trace_file
+        self.pattern_cache = None
+        self.reset()
+
+    def reset(self):
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.pattern_matches = 0
+        self.elapsed = 0.0
+        self.timings = {name: [0, 0.0] for name in TIMED_METHODS}
+        # depth -> [variables selected, min, max, total candidates]
+        self.domain_sizes: Dict[int, list] = {}
+        # The pattern cache is shared per process; hits and misses are
+        # reported relative to this snapshot.
+        self._pattern_cache_start = (
+            self.pattern_cache.stats() if self.pattern_cache is not None else None)
+
+    def attach(self, solver) -> "SearchInstrumentation":
+        if hasattr(solver.pattern_index, "stats"):
+            self.pattern_cache = solver.pattern_index
+            self._pattern_cache_start = self.pattern_cache.stats()
+        for name in TIMED_METHODS:
+            setattr(solver, name, self._timed(name, getattr(solver, name)))
+        solver.word_index = _CountingIndex(solver.word_index, self)
+        solver.pattern_index = _CountingIndex(solver.pattern_index, self)
+
+        solve = solver.solve
+
+        @wraps(solve)
+        def observed_solve(*args, **kwargs):
+            return self.observe(solve(*args, **kwargs))
+
+        solver.solve = observed_solve
+
+        order_domain_values = solver.order_domain_values
+        select_variable_by_domain = solver.select_variable_by_domain
+
+        @wraps(order_domain_values)
+        def recorded_order(var, state):
+            values = order_domain_values(var, state)
+            self.record_domain_size(len(state), len(values))
+            return values
+
+        @wraps(select_variable_by_domain)
+        def recorded_select(state, domains):
+            var = select_variable_by_domain(state, domains)
+            if var is not None:
+                self.record_domain_size(len(state), domains[var].bit_count())
+            return var
+
+        solver.order_domain_values = recorded_order
+        solver.select_variable_by_domain = recorded_select
+        return self
+
+    def _timed(self, name, method):
+        timing = self.timings[name]
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timing[0] += 1
+                timing[1] += time.perf_counter() - start
+
+        return timed
+
+    def record_domain_size(self, depth: int, size: int):
+        stats = self.domain_sizes.get(depth)
+        if stats is None:
+            self.domain_sizes[depth] = [1, size, size, size]
+        else:
+            stats[0] += 1
+            stats[1] = min(stats[1], size)
+            stats[2] = max(stats[2], size)
+            stats[3] += size
+
+    def observe(self, stream):
+        """Count nodes and backtracks of a solve() stream, tracing each node."""
+        trace = open(self.trace_file, "w") if self.trace_file else None
+        start = time.perf_counter()
+        depth = None
+        try:
+            for assignment in stream:
+                if depth is not None:
+                    self.backtracks += max(0, depth + 1 - len(assignment))
+                depth = len(assignment)
+                self.nodes += 1
+                self.max_depth = max(self.max_depth, depth)
+                if trace is not None:
+                    var = next(reversed(assignment)) if assignment else None
+                    trace.write(json.dumps({
+                        "node": self.nodes,
+                        "depth": depth,
+                        "elapsed": time.perf_counter() - start,
+                        "var": var,
+                        "word": assignment[var] if var is not None else None,
+                    }) + "\n")
+                yield assignment
+        finally:
+            self.elapsed += time.perf_counter() - start
+            if trace is not None:
+                trace.close()
+
+    def pattern_cache_stats(self) -> Optional[dict]:
+        """The solver's pattern cache, with hits/misses since attach or reset."""
+        if self.pattern_cache is None:
+            return None
+        stats = self.pattern_cache.stats()
+        for key in ("id_hits", "id_misses", "count_hits", "count_misses"):
+            stats[key] -= self._pattern_cache_start[key]
+        return stats
+
+    def report(self) -> dict:
+        return {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "max_depth": self.max_depth,
+            "pattern_matches": self.pattern_matches,
+            "elapsed": self.elapsed,
+            "pattern_cache": self.pattern_cache_stats(),
+            "timings": {
+                name: {"calls": calls, "seconds": seconds}
+                for name, (calls, seconds) in self.timings.items()
+                if calls
+            },
+            "domain_sizes": [
+                {
+                    "depth": depth,
+                    "variables": count,
+                    "min": smallest,
+                    "max": largest,
+                    "mean": total / count,
+                }
+                for depth, (count, smallest, largest, total) in sorted(self.domain_sizes.items())
+            ],
+        }
+
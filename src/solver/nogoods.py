@@ -0,0 +1,41 @@
+from typing import Iterable, List, Optional
+
+
+class NogoodStore:
+    """Assignments proven not to extend to a solution within one solve.
+
+    A nogood is a set of (variable, word id) pairs. Nogoods are indexed by
+    each of their pairs, so checking a new assignment only looks at the
+    nogoods that mention it.
+    """
+
+    def __init__(self, max_size: int = 8, max_nogoods: int = 100_000):
+        self.max_size = max_size
+        self.max_nogoods = max_nogoods
+        self.num_nogoods = 0
+        self.hits = 0
+        self._by_assignment = {}
+
+    def add(self, word_ids: List[int], conflict: Iterable[int]):
+        conflict = list(conflict)
+        # Long nogoods rarely recur and cost more to check than they save.
+        if not conflict or len(conflict) > self.max_size:
+            return
+        if self.num_nogoods >= self.max_nogoods:
+            return
+
+        nogood = frozenset((var, word_ids[var]) for var in conflict)
+        for pair in nogood:
+            self._by_assignment.setdefault(pair, []).append(nogood)
+        self.num_nogoods += 1
+
+    def find_violated(self, var: int, word_id: int, word_ids: List[int]) -> Optional[set]:
+        """Return the variables of a nogood that assigning word_id to var completes."""
+        for nogood in self._by_assignment.get((var, word_id), ()):
+            if all(other == var or word_ids[other] == other_id for other, other_id in nogood):
+                self.hits += 1
+                return {other for other, _ in nogood}
+        return None
+
+    def __len__(self) -> int:
+        return self.num_nogoods
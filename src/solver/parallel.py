@@ -0,0 +1,108 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from src.solver.backtracking import CrosswordSolver
+from src.solver.events import assignment_events
+
+
+# How many search nodes a worker expands between checks of the stop event.
+CANCEL_CHECK_INTERVAL = 256
+
+_worker_solver = None
+_worker_stop = None
+
+
+def split_assignments(solver: CrosswordSolver, min_tasks: int, max_depth: int = 4) -> List[Dict[tuple, str]]:
+    """Expand the top of the search tree into independent partial assignments.
+
+    Levels are expanded breadth-first with the solver's own variable and
+    value ordering until there are at least ``min_tasks`` branches, so a
+    first slot with a single candidate (e.g. a revealed word) does not leave
+    every worker but one idle.
+    """
+    frontier = [{}]
+    for _ in range(max_depth):
+        if len(frontier) >= min_tasks:
+            break
+        expanded = []
+        for assignment in frontier:
+            state = solver.new_state(assignment)
+            var = solver.select_unassigned_variable(state)
+            if var is None:
+                expanded.append(assignment)
+                continue
+            words = solver.words_by_length[solver.lengths[var]]
+            for word_id in solver.order_domain_values(var, state):
+                if solver.is_consistent(var, word_id, state):
+                    expanded.append({**assignment, solver.variables[var]: words[word_id]})
+        frontier = expanded
+    return frontier
+
+
+def _init_worker(grid, dictionary, solver_options, stop_event):
+    global _worker_solver, _worker_stop
+    _worker_solver = CrosswordSolver(grid, dictionary=dictionary, **solver_options)
+    _worker_stop = stop_event
+
+
+def _solve_branch(initial_assignment: Dict[tuple, str]) -> Optional[Dict[tuple, str]]:
+    num_variables = len(_worker_solver.variables)
+    for nodes, assignment in enumerate(_worker_solver.solve(initial_assignment)):
+        if len(assignment) == num_variables:
+            return dict(assignment)
+        if nodes % CANCEL_CHECK_INTERVAL == 0 and _worker_stop.is_set():
+            return None
+    return None
+
+
+class ParallelCrosswordSolver:
+    """Split-search solver that explores top-level branches in a process pool.
+
+    ``solve()`` has the same shape as ``CrosswordSolver.solve()``: it yields
+    the empty root assignment, then the first complete assignment any worker
+    finds. Remaining workers are told to stop as soon as one succeeds.
+    """
+
+    def __init__(self, grid, dictionary=None, workers: Optional[int] = None, **solver_options):
+        self.solver = CrosswordSolver(grid, dictionary=dictionary, **solver_options)
+        self.grid = self.solver.grid
+        self.variables = self.solver.variables
+        self.workers = workers or os.cpu_count() or 1
+        self.solver_options = solver_options
+
+    def solve(self):
+        yield {}
+        if not self.variables:
+            return
+
+        branches = split_assignments(self.solver, min_tasks=self.workers * 4)
+        if not branches:
+            return
+
+        stop_event = multiprocessing.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(branches)),
+            initializer=_init_worker,
+            initargs=(self.solver.grid, self.solver.dictionary, self.solver_options, stop_event),
+        )
+        try:
+            pending = {executor.submit(_solve_branch, branch) for branch in branches}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    solution = future.result()
+                    if solution is not None:
+                        stop_event.set()
+                        yield solution
+                        return
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def solve_events(self):
+        return assignment_events(self.solve(), len(self.variables))
+
+    def get_grid_with_solution(self, assignment: Dict[tuple, str]):
+        return self.solver.get_grid_with_solution(assignment)
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from src.solver.budget import SolveResult, SolveStatus
+
+
+# Only definite outcomes are cached; a budget running out says nothing about
+# the puzzle.
+CACHED_STATUSES = (SolveStatus.SOLVED, SolveStatus.UNSATISFIABLE)
+
+
+def transpose(rows: List[str]) -> List[str]:
+    return ["".join(column) for column in zip(*rows)]
+
+
+def canonical_grid(grid: List[List[str]]) -> Tuple[List[str], bool]:
+    """Return the canonical orientation of a grid and whether it is transposed.
+
+    Transposing swaps across and down slots but keeps every word readable,
+    so a grid and its transpose have the same solutions. Mirroring does not
+    (words would read backwards) and is deliberately not folded together.
+    """
+    rows = ["".join(row) for row in grid]
+    transposed = transpose(rows)
+    if transposed < rows:
+        return transposed, True
+    return rows, False
+
+
+class SolutionCache:
+    """LRU cache of solved puzzles in front of ``CrosswordSolver``.
+
+    Entries are keyed by the canonical grid (see ``canonical_grid``) and the
+    dictionary's content version, and hold the solved grid, or nothing for
+    an unsatisfiable one. With ``path`` the entries are also written to a
+    SQLite file, which several processes may share and which survives
+    restarts; it keeps at most ``max_disk_entries``, dropping the least
+    recently used.
+    """
+
+    def __init__(self, max_entries: int = 4096, path=None, max_disk_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, Optional[List[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS solutions "
+                "(key TEXT PRIMARY KEY, solution TEXT, used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)")
+            self._disk_entries = self._db.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    @staticmethod
+    def key(solver) -> Tuple[str, bool]:
+        rows, transposed = canonical_grid(solver.grid)
+        digest = hashlib.sha1(solver.dictionary.version.encode())
+        digest.update("\n".join(rows).encode("utf-8", "surrogatepass"))
+        return digest.hexdigest(), transposed
+
+    def get(self, solver) -> Optional[SolveResult]:
+        start = time.monotonic()
+        key, transposed = self.key(solver)
+        found, solution = self._lookup(key)
+        if not found:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        if solution is None:
+            return SolveResult(SolveStatus.UNSATISFIABLE, elapsed=time.monotonic() - start)
+        if transposed:
+            solution = transpose(solution)
+        assignment = {}
+        for var in solver.variables:
+            r, c, direction, length = var
+            if direction == "across":
+                assignment[var] = solution[r][c:c + length]
+            else:
+                assignment[var] = "".join(solution[r + i][c] for i in range(length))
+        return SolveResult(SolveStatus.SOLVED, assignment, elapsed=time.monotonic() - start)
+
+    def put(self, solver, result: SolveResult):
+        if result.status not in CACHED_STATUSES:
+            return
+        key, transposed = self.key(solver)
+        solution = None
+        if result.solved:
+            solution = ["".join(row) for row in solver.get_grid_with_solution(result.assignment)]
+            if transposed:
+                solution = transpose(solution)
+        self._remember(key, solution)
+        if self._db is not None:
+            self._store(key, solution)
+
+    def solve_bounded(self, solver, **options) -> SolveResult:
+        """``solver.solve_bounded(**options)``, answered from the cache if possible."""
+        if options.get("initial_assignment"):
+            return solver.solve_bounded(**options)
+        result = self.get(solver)
+        if result is None:
+            result = solver.solve_bounded(**options)
+            self.put(solver, result)
+        return result
+
+    def _lookup(self, key: str) -> Tuple[bool, Optional[List[str]]]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+        if self._db is None:
+            return False, None
+
+        row = self._db.execute("SELECT solution FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False, None
+        self._db.execute("UPDATE solutions SET used = ? WHERE key = ?", (time.time(), key))
+        solution = json.loads(row[0])
+        self._remember(key, solution)
+        return True, solution
+
+    def _remember(self, key: str, solution: Optional[List[str]]):
+        self._entries[key] = solution
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _store(self, key: str, solution: Optional[List[str]]):
+        # Replacing a row also counts as an insert; the count is an upper
+        # bound that is re-read whenever it triggers a trim.
+        inserted = self._db.execute(
+            "INSERT OR REPLACE INTO solutions (key, solution, used) VALUES (?, ?, ?)",
+            (key, json.dumps(solution), time.time()),
+        ).rowcount
+        self._disk_entries += inserted
+        if self._disk_entries > self.max_disk_entries:
+            # Trim a tenth at a time so eviction does not run on every insert.
+            excess = self._disk_entries - self.max_disk_entries * 9 // 10
+            self._db.execute(
+                "DELETE FROM solutions WHERE key IN "
+                "(SELECT key FROM solutions ORDER BY used LIMIT ?)",
+                (excess,),
+            )
+            self._disk_entries = self._db.execute(
+                "SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def clear(self):
+        self._entries.clear()
+        if self._db is not None:
+            self._db.execute("DELETE FROM solutions")
+            self._disk_entries = 0
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
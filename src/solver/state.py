@@ -0,0 +1,76 @@
+from array import array
+from typing import Dict, List
+
+
+# word_ids entry of a variable with no word.
+UNASSIGNED = -1
+# word_ids entry of a pre-assigned word that is not in the dictionary.
+FOREIGN_WORD = -2
+
+
+class SearchState:
+    """Assignment of one search, indexed by variable and word ids.
+
+    ``assignment`` is the public {variable tuple: word} dict that ``solve()``
+    yields; it is updated in place, in stack order. Alongside it the search
+    reads preallocated arrays indexed by variable id:
+
+    - ``word_ids[var]``: the assigned word's id in its length bucket, or
+      UNASSIGNED;
+    - ``patterns[var]``: the slot's current letters, '' where open, kept up
+      to date as crossing words are assigned and removed;
+    - ``used[length][word_id]``: the variable holding that word, or UNASSIGNED.
+    """
+
+    __slots__ = (
+        "variables",
+        "lengths",
+        "crossings",
+        "base_patterns",
+        "assignment",
+        "word_ids",
+        "patterns",
+        "used",
+        "num_assigned",
+    )
+
+    def __init__(self, solver):
+        self.variables = solver.variables
+        self.lengths = solver.lengths
+        self.crossings = solver.crossings
+        self.base_patterns = solver.base_patterns
+        self.assignment: Dict[tuple, str] = {}
+        self.word_ids: List[int] = [UNASSIGNED] * len(self.variables)
+        self.patterns: List[List[str]] = [pattern[:] for pattern in self.base_patterns]
+        self.used: Dict[int, array] = {
+            length: array("i", [UNASSIGNED]) * len(solver.words_by_length.get(length, ()))
+            for length in solver.slots_by_length
+        }
+        self.num_assigned = 0
+
+    def assign(self, var: int, word_id: int, word: str):
+        self.assignment[self.variables[var]] = word
+        self.word_ids[var] = word_id
+        if word_id >= 0:
+            self.used[self.lengths[var]][word_id] = var
+        patterns = self.patterns
+        for other, idx_in_var, idx_in_other in self.crossings[var]:
+            patterns[other][idx_in_other] = word[idx_in_var]
+        self.num_assigned += 1
+
+    def unassign(self, var: int):
+        word_id = self.word_ids[var]
+        if word_id >= 0:
+            self.used[self.lengths[var]][word_id] = UNASSIGNED
+        del self.assignment[self.variables[var]]
+        self.word_ids[var] = UNASSIGNED
+        # A cell belongs to at most two slots, so once this word is gone the
+        # crossing slot's cell falls back to the grid's own letter.
+        patterns = self.patterns
+        base_patterns = self.base_patterns
+        for other, _, idx_in_other in self.crossings[var]:
+            patterns[other][idx_in_other] = base_patterns[other][idx_in_other]
+        self.num_assigned -= 1
+
+    def __len__(self) -> int:
+        return self.num_assigned
@@ -0,0 +1,99 @@
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
+
+from src.dictionary.word_index import WordIndex
+
+
+class LeastConstrainingValue:
+    """Least-constraining-value ordering of a slot's candidate words.
+
+    A candidate scores the product, over the slot's open crossings, of how
+    many words of the crossing slot's current pattern share the letter the
+    candidate would put in the shared cell; candidates that leave the most
+    options come first, ties keep their dictionary order, and a candidate
+    that leaves a crossing no word at all goes last.
+
+    The letter counts of a crossing depend only on its length, the crossing
+    position and its pattern, so they are kept in an LRU cache of at most
+    ``max_entries`` patterns. Fully open patterns are answered from the word
+    index's precomputed letter frequency tables.
+    """
+
+    def __init__(self, word_index: WordIndex, max_entries: int = 65536):
+        self.word_index = word_index
+        self.max_entries = max_entries
+        self._supports: "OrderedDict[tuple, Dict[str, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def supports(self, length: int, position: int, pattern: Sequence[str]) -> Dict[str, int]:
+        """Letter -> number of words matching ``pattern`` with it at ``position``."""
+        if not any(pattern):
+            frequencies = self.word_index.letter_frequencies(length)
+            # No words of this length: no letter is supported.
+            return frequencies[position] if frequencies else {}
+
+        key = (length, position, tuple(pattern))
+        counts = self._supports.get(key)
+        if counts is not None:
+            self._supports.move_to_end(key)
+            self.hits += 1
+            return counts
+
+        self.misses += 1
+        counts = self.word_index.letter_counts(
+            length, position, self.word_index.match_mask(length, pattern))
+        self._supports[key] = counts
+        if len(self._supports) > self.max_entries:
+            self._supports.popitem(last=False)
+        return counts
+
+    def order(
+        self,
+        words: Sequence[str],
+        word_ids: List[int],
+        crossings: List[Tuple[int, int, int, Sequence[str]]],
+    ) -> List[int]:
+        """Sort ``word_ids`` by score, best first.
+
+        ``crossings`` holds (offset in the slot, crossing length, offset in
+        the crossing, crossing pattern) for every open crossing slot.
+        """
+        if not crossings or len(word_ids) < 2:
+            return word_ids
+        supports = [
+            (offset, self.supports(length, other_offset, pattern))
+            for offset, length, other_offset, pattern in crossings
+        ]
+
+        def score(word_id: int) -> int:
+            word = words[word_id]
+            total = 1
+            for offset, counts in supports:
+                total *= counts.get(word[offset], 0)
+                if not total:
+                    break
+            return total
+
+        return sorted(word_ids, key=score, reverse=True)
+
+    def clear(self):
+        self._supports.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._supports), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._supports)
+
+
+_shared = weakref.WeakKeyDictionary()
+
+
+def shared_value_ordering(dictionary) -> LeastConstrainingValue:
+    """The process-wide ordering for a dictionary, so its cache outlives one solve."""
+    ordering = _shared.get(dictionary)
+    if ordering is None:
+        ordering = _shared[dictionary] = LeastConstrainingValue(dictionary.word_index)
+    return ordering
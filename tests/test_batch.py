@@ -0,0 +1,36 @@
+import json
+
+from src.solver import batch
+from src.solver.backtracking import CrosswordSolver
+
+
+GRID = ["   #   ", "       ", "   #   ", "## # ##", "   #   ", "       ", "   #   "]
+
+
+def test_solve_line_reports_parse_errors():
+    assert batch.solve_line(3, "not json")["error"]
+    assert batch.solve_line(4, json.dumps(["a$"]))["error"] == "invalid cell '$'"
+
+
+def test_solve_line_reports_solver_errors(monkeypatch):
+    def broken(self, **options):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(CrosswordSolver, "solve_bounded", broken)
+    record = batch.solve_line(0, json.dumps({"id": "p", "grid": GRID}))
+    assert record == {"index": 0, "id": "p", "error": "RuntimeError: boom"}
+
+
+def test_solve_line_solves_grid():
+    record = batch.solve_line(0, json.dumps(GRID), time_limit=10)
+    assert record["status"] == "solved"
+    assert all(" " not in row for row in record["grid"])
+
+
+def test_solve_batch_keeps_input_order_and_skips_blank_lines():
+    lines = [json.dumps(GRID), "", "oops", json.dumps({"id": "x", "grid": ["##c", "   "]})]
+    records = list(batch.solve_batch(lines, workers=2, time_limit=10))
+    assert [record["index"] for record in records] == [0, 2, 3]
+    assert records[0]["status"] == "solved"
+    assert "error" in records[1]
+    assert records[2]["id"] == "x" and records[2]["status"] == "unsatisfiable"
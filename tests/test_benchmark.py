@@ -0,0 +1,65 @@
+import io
+import json
+
+from benchmarks.solver_benchmark import (
+    build_corpus, clear_caches, compare, main, measure_peak_memory, run_benchmark, run_solver)
+from src.dictionary.word_loader import get_dictionary
+
+
+def test_corpus_is_reproducible():
+    first, second = (build_corpus([(9, 6)], (0.0, 0.3), range(2)) for _ in range(2))
+    for puzzle in (*first, *second):
+        del puzzle["generation_time"]
+    assert first == second
+    assert len(first) == 4
+    assert len({puzzle["id"] for puzzle in first}) == 4
+
+
+def test_report():
+    puzzles = build_corpus([(9, 6)], (0.3,), range(1))
+    report = run_benchmark(
+        ["default", "backjumping"], puzzles, node_limit=2000, time_limit=5.0, log=io.StringIO())
+    assert [result["config"] for result in report["results"]] == ["default", "backjumping"]
+    for result in report["results"]:
+        assert result["status"] in ("solved", "unsatisfiable", "node_limit", "time_limit")
+        assert result["nodes"] > 0 and result["peak_memory"] > 0
+    assert report["summary"]["default"]["puzzles"] == 1
+    assert "grid" not in report["puzzles"][0]
+    json.dumps(report)
+
+    out = io.StringIO()
+    compare(report, report, out=out)
+    assert "x1.00" in out.getvalue()
+
+
+def test_saved_corpus_round_trip(tmp_path):
+    corpus, first, second = tmp_path / "corpus.json", tmp_path / "a.json", tmp_path / "b.json"
+    options = ["--configs", "default", "--sizes", "9", "--seeds", "1", "--no-memory",
+               "--node-limit", "500"]
+    main([*options, "--save-corpus", str(corpus), "-o", str(first)])
+    main([*options, "--corpus", str(corpus), "-o", str(second)])
+    first, second = json.loads(first.read_text()), json.loads(second.read_text())
+    assert first["puzzles"] == second["puzzles"]
+    assert [result["nodes"] for result in first["results"]] == \
+        [result["nodes"] for result in second["results"]]
+
+
+def test_every_run_starts_with_cold_caches():
+    puzzles = build_corpus([(9, 6)], (0.0,), range(1))
+    report = run_benchmark(
+        ["lcv", "default", "lcv"], puzzles, node_limit=500, time_limit=5.0, memory=False,
+        log=io.StringIO())
+    first, _, again = report["results"]
+    assert first["pattern_cache_misses"] > 0
+    assert again["pattern_cache_misses"] == first["pattern_cache_misses"]
+    assert again["pattern_cache_hits"] == first["pattern_cache_hits"]
+
+
+def test_peak_memory_does_not_depend_on_warm_caches():
+    grid = build_corpus([(9, 6)], (0.0,), range(1))[0]["grid"]
+    clear_caches(get_dictionary())
+    cold = measure_peak_memory(grid, {}, 500, 5.0)
+    # The benchmark measures memory right after the timed run of the same puzzle.
+    run_solver(grid, {}, 500, 5.0)
+    after_timed_run = measure_peak_memory(grid, {}, 500, 5.0)
+    assert abs(after_timed_run - cold) < cold * 0.05
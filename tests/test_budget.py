@@ -0,0 +1,49 @@
+import threading
+
+from src.dictionary.dictionary import Dictionary
+from src.dictionary.word_loader import get_dictionary
+from src.solver.backtracking import CrosswordSolver
+from src.solver.budget import CancellationToken, SolveStatus
+
+
+OPEN_GRID = [[" "] * 6 for _ in range(6)]
+
+
+def test_node_limit():
+    result = CrosswordSolver(OPEN_GRID, dictionary=get_dictionary()).solve_bounded(node_limit=50)
+    assert result.status == SolveStatus.NODE_LIMIT
+    assert result.budget_exhausted and not result.solved
+    assert result.nodes == 50
+    # The deepest partial assignment reached is kept.
+    assert 0 < len(result.assignment) < 12
+
+
+def test_time_limit():
+    result = CrosswordSolver(OPEN_GRID, dictionary=get_dictionary()).solve_bounded(time_limit=0.05)
+    assert result.status == SolveStatus.TIME_LIMIT
+    assert result.budget_exhausted
+    assert result.elapsed < 5
+
+
+def test_cancellation():
+    token = CancellationToken()
+    timer = threading.Timer(0.05, token.cancel)
+    timer.start()
+    try:
+        result = CrosswordSolver(OPEN_GRID, dictionary=get_dictionary()).solve_bounded(
+            cancel_token=token)
+    finally:
+        timer.cancel()
+    assert result.status == SolveStatus.CANCELLED
+    assert not result.budget_exhausted
+
+
+def test_finished_searches_ignore_the_budget():
+    dictionary = Dictionary(["cat", "car", "arc"])
+    solved = CrosswordSolver([list("cat")], dictionary=dictionary).solve_bounded(node_limit=10)
+    assert solved.status == SolveStatus.SOLVED
+    assert solved.assignment == {(0, 0, "across", 3): "cat"}
+
+    grid = [list("   "), list(" # "), list("   ")]
+    failed = CrosswordSolver(grid, dictionary=dictionary).solve_bounded(node_limit=10_000)
+    assert failed.status == SolveStatus.UNSATISFIABLE
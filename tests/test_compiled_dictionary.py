@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+
+from src.dictionary.compiled import CompiledDictionary, compile_dictionary, is_compiled_dictionary
+from src.dictionary.dictionary import Dictionary
+from src.dictionary.word_loader import get_dictionary
+from src.solver.backtracking import CrosswordSolver
+
+
+WORDS = ["cat", "car", "cot", "arc", "tar", "rat", "bat", "scat", "cast", "cart", "a", "ab"]
+
+
+@pytest.fixture
+def compiled(tmp_path):
+    return CompiledDictionary(compile_dictionary(WORDS, tmp_path / "words.bin"))
+
+
+def test_round_trip(compiled):
+    dictionary = Dictionary(WORDS)
+    assert {length: list(bucket) for length, bucket in compiled.words_by_length.items()} == {
+        length: list(bucket) for length, bucket in dictionary.words_by_length.items()}
+    assert compiled.words == dictionary.words
+    assert compiled.version == dictionary.version
+    assert len(compiled) == len(dictionary)
+    assert "scat" in compiled and "scar" not in compiled and "" not in compiled
+
+
+def test_index_matches_the_source(compiled):
+    index = Dictionary(WORDS).word_index
+    for length, pattern in [(3, ["c", "", ""]), (3, ["", "a", "t"]), (4, ["", "", "", "t"]),
+                            (3, ["z", "", ""]), (5, [""] * 5)]:
+        assert compiled.word_index.match(length, pattern) == index.match(length, pattern)
+        assert compiled.word_index.count(length, pattern) == index.count(length, pattern)
+
+
+def test_packed_words_behave_like_a_sequence(compiled):
+    bucket = compiled.words_by_length[3]
+    assert bucket[0] == "arc" and bucket[-1] == "tar"
+    assert bucket[1:3] == ["bat", "car"]
+    with pytest.raises(IndexError):
+        bucket[len(bucket)]
+
+
+def test_solves_like_the_source(compiled):
+    grid = [list("   "), list("#  "), list("#  ")]
+    assert CrosswordSolver(grid, dictionary=compiled).solve_bounded().status == \
+        CrosswordSolver(grid, dictionary=Dictionary(WORDS)).solve_bounded().status
+
+
+def test_loading(tmp_path, compiled):
+    assert is_compiled_dictionary(compiled.path)
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("cat\n")
+    assert not is_compiled_dictionary(word_file)
+    with pytest.raises(ValueError):
+        compile_dictionary(["€uro"], tmp_path / "bad.bin")
+
+    assert isinstance(get_dictionary(compiled.path), CompiledDictionary)
+    # Pickling re-maps the file rather than copying it.
+    assert pickle.loads(pickle.dumps(compiled)).path == compiled.path
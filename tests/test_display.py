@@ -0,0 +1,89 @@
+import itertools
+import shutil
+
+import pytest
+
+from src.display import (
+    CrosswordFigure, animate_solution, display_crossword, fill_grid, render_text)
+from src.solver.backtracking import CrosswordSolver
+
+
+GRID = [list(row) for row in ["   #   ", "       ", "   #   ", "## # ##", "   #   ", "       ", "   #   "]]
+
+
+def clue_words(solver):
+    return [{"word": "", "row": r, "col": c, "direction": d} for r, c, d, _ in solver.variables]
+
+
+def test_text_and_svg_output(tmp_path):
+    solver = CrosswordSolver(GRID)
+    solution = solver.solve_bounded(time_limit=10).assignment
+    display_crossword(fill_grid(GRID, solution), clue_words(solver), output=tmp_path / "grid.txt")
+    assert (tmp_path / "grid.txt").read_text(encoding="utf-8") == render_text(
+        solver.get_grid_with_solution(solution))
+    display_crossword(GRID, clue_words(solver), output=tmp_path / "grid.svg")
+    assert (tmp_path / "grid.svg").read_text(encoding="utf-8").startswith("<svg")
+
+
+def test_gif_has_a_frame_per_node(tmp_path):
+    pytest.importorskip("matplotlib")
+    Image = pytest.importorskip("PIL.Image")
+    solver = CrosswordSolver(GRID)
+    stream = itertools.islice(solver.solve(), 40)
+    animate_solution(GRID, clue_words(solver), stream, output=tmp_path / "solve.gif", interval=50)
+    with Image.open(tmp_path / "solve.gif") as gif:
+        nodes = sum(1 for _ in itertools.islice(CrosswordSolver(GRID).solve(), 40))
+        assert gif.n_frames == nodes + 1
+        assert gif.info["duration"] == 50
+
+
+def test_mp4_output(tmp_path):
+    matplotlib = pytest.importorskip("matplotlib")
+    if shutil.which(matplotlib.rcParams["animation.ffmpeg_path"]) is None:
+        pytest.skip("ffmpeg is not installed")
+    solver = CrosswordSolver(GRID)
+    animate_solution(GRID, clue_words(solver), solver.solve(), output=tmp_path / "solve.mp4")
+    assert (tmp_path / "solve.mp4").stat().st_size > 0
+
+
+def test_unknown_animation_format(tmp_path):
+    with pytest.raises(ValueError):
+        animate_solution(GRID, [], iter(()), output=tmp_path / "solve.avi")
+
+
+def test_interactive_frames_keep_unchanged_letters(monkeypatch):
+    pytest.importorskip("matplotlib")
+    np = pytest.importorskip("numpy")
+    import matplotlib.animation as animation
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    plt.switch_backend("Agg")
+    animations = []
+
+    class RecordedAnimation(animation.FuncAnimation):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            animations.append(self)
+
+    monkeypatch.setattr(animation, "FuncAnimation", RecordedAnimation)
+    monkeypatch.setattr(plt, "show", lambda: None)
+
+    grid = [list("   "), list(" # "), list("   ")]
+    across, down = (0, 0, "across", 3), (0, 0, "down", 3)
+    # The last frame changes nothing; its letters must still be drawn.
+    frames = [{across: "cat"}, {across: "cat", down: "cot"}, {across: "cat", down: "cot"}]
+    animate_solution(grid, [], iter(frames))
+    (anim,) = animations
+    canvas = anim._fig.canvas
+    canvas.draw()
+    try:
+        for assignment in frames:
+            anim._step()
+            expected = CrosswordFigure(fill_grid(grid, assignment))
+            FigureCanvasAgg(expected.figure).draw()
+            assert np.array_equal(
+                np.asarray(canvas.buffer_rgba()),
+                np.asarray(expected.figure.canvas.buffer_rgba()))
+    finally:
+        plt.close(anim._fig)
@@ -0,0 +1,78 @@
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import CrosswordSolver
+from src.solver.events import (
+    ASSIGN, FAILED, SOLVED, UNASSIGN, GridTracker, SolveEvent, assignment_events)
+
+
+A = (0, 0, "across", 3)
+B = (0, 0, "down", 3)
+C = (0, 2, "down", 3)
+
+
+def replay(events):
+    assignment = {}
+    for event in events:
+        if event.kind == ASSIGN:
+            assignment[event.var] = event.word
+        elif event.kind == UNASSIGN:
+            del assignment[event.var]
+    return assignment
+
+
+def stack_stream():
+    # One dict mutated in stack order, as the solvers do.
+    assignment = {}
+    yield assignment
+    assignment[A] = "cat"
+    yield assignment
+    assignment[B] = "car"
+    yield assignment
+    del assignment[B]
+    assignment[B] = "cot"
+    yield assignment
+    del assignment[B]
+    del assignment[A]
+    assignment[A] = "arc"
+    yield assignment
+
+
+def test_stack_deltas():
+    assert list(assignment_events(stack_stream(), 3)) == [
+        SolveEvent(ASSIGN, A, "cat"),
+        SolveEvent(ASSIGN, B, "car"),
+        SolveEvent(ASSIGN, B, "cot"),
+        SolveEvent(UNASSIGN, B),
+        SolveEvent(ASSIGN, A, "arc"),
+        SolveEvent(FAILED),
+    ]
+
+
+def test_fresh_dicts_are_diffed():
+    stream = [{A: "cat"}, {A: "cat", B: "car", C: "tar"}, {C: "tar"}]
+    events = list(assignment_events(stream, 4))
+    assert events[-1] == SolveEvent(FAILED)
+    assert replay(events) == {C: "tar"}
+
+
+def test_sampling_emits_net_changes():
+    events = list(assignment_events(stack_stream(), 3, sample_every=100))
+    assert events == [SolveEvent(ASSIGN, A, "arc"), SolveEvent(FAILED)]
+
+
+@pytest.mark.parametrize("sample_every", [1, 3])
+def test_tracker_follows_a_real_solve(sample_every):
+    grid = [list("   "), list(" # "), list("   ")]
+    dictionary = Dictionary(["cat", "car", "cot", "arc", "tar", "rat", "ore", "ate", "ear", "toe"])
+    solver = CrosswordSolver(grid, dictionary=dictionary)
+    solution = solver.solve_bounded().assignment
+
+    tracker = GridTracker(solver.grid)
+    events = list(solver.solve_events(sample_every=sample_every))
+    for event in events:
+        for r, c, letter in tracker.apply(event):
+            assert tracker.grid[r][c] == letter
+    assert events[-1] == SolveEvent(SOLVED)
+    assert tracker.assignment == solution
+    assert tracker.grid == solver.get_grid_with_solution(solution)
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+from src.generator.generator import CrosswordGenerator
+
+
+@pytest.mark.parametrize("size", [15, 21, 25])
+def test_generate_any_supported_size(size):
+    grid, words = CrosswordGenerator(size=size, seed=1).generate(num_words=10)
+    assert len(grid) == size and all(len(row) == size for row in grid)
+    assert words
+
+
+def test_start_word_falls_back_to_longest_fitting_length():
+    dictionary = Dictionary(["cat", "dog", "house"])
+    grid, words = CrosswordGenerator(size=9, dictionary=dictionary, seed=0).generate(num_words=1)
+    assert words[0]["word"] == "house"
+
+
+def test_generate_without_fitting_words_raises():
+    dictionary = Dictionary(["crosswords"])
+    with pytest.raises(ValueError):
+        CrosswordGenerator(size=5, dictionary=dictionary, seed=0).generate(num_words=3)
+
+
+def test_same_seed_same_puzzle():
+    first = CrosswordGenerator(size=13, seed=7).generate(num_words=15)
+    second = CrosswordGenerator(size=13, seed=7).generate(num_words=15)
+    assert first == second
+
+
+def reference_can_place(grid, word, row, col, direction):
+    """The full scan the incremental ``blocked`` tables replace."""
+    size = len(grid)
+    dr, dc = (0, 1) if direction == "across" else (1, 0)
+    if row < 0 or col < 0 or row + dr * len(word) > size or col + dc * len(word) > size:
+        return False
+    for i, letter in enumerate(word):
+        r, c = row + dr * i, col + dc * i
+        if grid[r][c] not in ("", letter):
+            return False
+        if grid[r][c] == "":
+            for nr, nc in ((r - dc, c - dr), (r + dc, c + dr)):
+                if 0 <= nr < size and 0 <= nc < size and grid[nr][nc] not in ("", "#"):
+                    return False
+    for r, c in ((row - dr, col - dc), (row + dr * len(word), col + dc * len(word))):
+        if 0 <= r < size and 0 <= c < size and grid[r][c] not in ("", "#"):
+            return False
+    return True
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_legality_matches_a_full_scan(seed, monkeypatch):
+    generator = CrosswordGenerator(size=11, seed=seed)
+    rng = random.Random(seed)
+    words = [word for length in (3, 4, 5) for word in generator.words_by_length[length][:300]]
+    place_word = generator.place_word
+
+    def checked_place_word(*args):
+        place_word(*args)
+        for _ in range(300):
+            word = rng.choice(words)
+            # Mostly words through existing letters, where the checks matter.
+            placed = rng.choice(generator.words)
+            # Callers only pass rows and columns that are inside the grid.
+            row = min(placed["row"] + rng.randint(-3, 3), 10)
+            col = min(placed["col"] + rng.randint(-3, 3), 10)
+            direction = rng.choice(["across", "down"])
+            assert generator.can_place_word(word, row, col, direction) == \
+                reference_can_place(generator.grid, word, row, col, direction)
+        for r, c, direction in generator.open_slots:
+            assert generator.grid[r][c] and not generator.covered[direction][r][c]
+
+    monkeypatch.setattr(generator, "place_word", checked_place_word)
+    generator.generate(num_words=20)
+
+
+def test_crossing_words_come_from_the_pattern_index():
+    words = ["cat", "car", "arc", "tar", "rat", "act", "scat", "cast", "cart", "tsar", "star",
+             "carts", "trams", "smart"]
+    generator = CrosswordGenerator(size=7, dictionary=Dictionary(words), seed=3)
+    generator.place_word("carts", 3, 1, "across")
+    placed = {"carts"}
+    for slot in list(generator.open_slots):
+        r, c, direction = slot
+        placement = generator._find_crossing_word(slot, placed)
+        # Every legal placement through the slot's cell, found by brute force.
+        legal = {
+            (word, row, col)
+            for word in words if word not in placed
+            for i in range(len(word))
+            for row, col in [(r - i, c) if direction == "down" else (r, c - i)]
+            if generator.can_place_word(word, row, col, direction)
+        }
+        if placement is None:
+            assert not legal
+        else:
+            assert placement in legal
@@ -0,0 +1,28 @@
+import json
+
+from src.generator.batch import PuzzleSpec, generate_batch, generate_puzzle, main
+
+
+SPECS = [PuzzleSpec(9, 8, seed) for seed in range(6)]
+
+
+def test_batch_matches_single_generation():
+    puzzles = list(generate_batch(iter(SPECS), workers=2, max_pending=2))
+    assert sorted(puzzle["index"] for puzzle in puzzles) == list(range(len(SPECS)))
+    for puzzle in puzzles:
+        expected = generate_puzzle(SPECS[puzzle["index"]])
+        assert {key: value for key, value in puzzle.items() if key != "index"} == expected
+
+
+def test_puzzles_are_json_lines(capsys):
+    main(["--size", "9", "--words", "5", "--count", "2", "--seed", "3", "--workers", "1"])
+    lines = capsys.readouterr().out.splitlines()
+    puzzles = sorted((json.loads(line) for line in lines), key=lambda puzzle: puzzle["index"])
+    assert [puzzle["seed"] for puzzle in puzzles] == [3, 4]
+    for puzzle in puzzles:
+        assert len(puzzle["grid"]) == 9 and all(len(row) == 9 for row in puzzle["grid"])
+        for word, row, col, direction in puzzle["words"]:
+            if direction == "across":
+                assert puzzle["grid"][row][col:col + len(word)] == word
+            else:
+                assert "".join(puzzle["grid"][row + i][col] for i in range(len(word))) == word
@@ -0,0 +1,75 @@
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import INFERENCE_MODES, CrosswordSolver
+
+
+DICTIONARY = Dictionary(["cat", "car", "cot", "arc", "tar", "rat", "ore", "ate", "ear", "toe"])
+GRID = [list("   "), list(" # "), list("   ")]
+ACROSS = (0, 0, "across", 3)
+MODES = [
+    {"inference": inference, "backjumping": backjumping}
+    for inference in INFERENCE_MODES
+    for backjumping in (False, True)
+]
+
+
+@pytest.mark.parametrize("options", MODES)
+@pytest.mark.parametrize("word", ["ca", "cats"])
+def test_words_of_the_wrong_length_are_rejected(options, word):
+    solver = CrosswordSolver(GRID, dictionary=DICTIONARY, **options)
+    with pytest.raises(ValueError, match=r"\(0, 0, 'across', 3\)"):
+        solver.solve_bounded(initial_assignment={ACROSS: word})
+    with pytest.raises(ValueError):
+        solver.new_state({ACROSS: word})
+
+
+@pytest.mark.parametrize("options", MODES)
+def test_unknown_slots_are_rejected(options):
+    solver = CrosswordSolver(GRID, dictionary=DICTIONARY, **options)
+    with pytest.raises(ValueError, match="not a slot"):
+        solver.solve_bounded(initial_assignment={(1, 0, "across", 3): "cat"})
+
+
+def assert_fills_grid(solver, assignment, initial):
+    assert set(assignment) == set(solver.variables)
+    assert initial.items() <= assignment.items()
+    grid = solver.get_grid_with_solution(assignment)
+    for (r, c, direction, length), word in assignment.items():
+        cells = [grid[r][c + i] if direction == "across" else grid[r + i][c]
+                 for i in range(length)]
+        assert "".join(cells) == word
+
+
+@pytest.mark.parametrize("options", MODES)
+@pytest.mark.parametrize("grid, initial, solved", [
+    # Not dictionary words: their letters are fixed and the rest is solved.
+    (GRID, {ACROSS: "cxr"}, True),
+    (GRID, {ACROSS: "qqq"}, False),
+    # No dictionary word has the seeded slot's length.
+    ([list("    "), list(" ## "), list(" ## ")], {(0, 0, "across", 4): "cqqr"}, True),
+    # A dictionary word, for comparison.
+    (GRID, {ACROSS: "car"}, True),
+])
+def test_every_mode_accepts_the_same_initial_words(options, grid, initial, solved):
+    dictionary = Dictionary([*DICTIONARY.words, "tat"])
+    solver = CrosswordSolver(grid, dictionary=dictionary, **options)
+    result = solver.solve_bounded(initial_assignment=initial)
+    assert result.solved == solved
+    if solved:
+        assert_fills_grid(solver, result.assignment, initial)
+
+
+@pytest.mark.parametrize("options", MODES)
+@pytest.mark.parametrize("grid, initial", [
+    # Clashes with a letter in the grid.
+    ([list("  x"), list(" # "), list("   ")], {ACROSS: "cat"}),
+    # Clashes with a crossing initial word.
+    (GRID, {ACROSS: "cat", (0, 0, "down", 3): "ore"}),
+    # The same word twice.
+    (GRID, {ACROSS: "cat", (2, 0, "across", 3): "cat"}),
+])
+def test_initial_words_that_cannot_all_be_placed_are_rejected(options, grid, initial):
+    solver = CrosswordSolver(grid, dictionary=DICTIONARY, **options)
+    with pytest.raises(ValueError):
+        solver.solve_bounded(initial_assignment=initial)
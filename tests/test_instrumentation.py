@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import INFERENCE_MODES, CrosswordSolver
+
+
+DICTIONARY = Dictionary([
+    "cat", "car", "cot", "arc", "tar", "rat", "ore", "ate", "ear", "toe", "at", "to", "re",
+])
+GRID = [list("   "), list(" # "), list("#  ")]
+
+
+def snapshots(solver):
+    return [dict(assignment) for assignment in solver.solve()]
+
+
+@pytest.mark.parametrize("inference", INFERENCE_MODES)
+def test_instrumented_search_is_unchanged(inference, tmp_path):
+    expected = snapshots(CrosswordSolver(GRID, dictionary=DICTIONARY, inference=inference))
+
+    solver = CrosswordSolver(GRID, dictionary=DICTIONARY, inference=inference)
+    trace_file = tmp_path / "trace.jsonl"
+    instrumentation = solver.instrument(str(trace_file))
+    assert snapshots(solver) == expected
+
+    report = instrumentation.report()
+    assert report["nodes"] == len(expected)
+    assert report["max_depth"] == max(len(assignment) for assignment in expected)
+    assert report["backtracks"] == sum(
+        max(0, len(before) + 1 - len(after)) for before, after in zip(expected, expected[1:]))
+    assert report["pattern_matches"] > 0
+    assert report["domain_sizes"] and report["timings"]
+    json.dumps(report)
+
+    trace = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert [node["depth"] for node in trace] == [len(assignment) for assignment in expected]
+    assert trace[-1]["word"] == expected[-1][tuple(trace[-1]["var"])]
+
+
+def test_reset():
+    solver = CrosswordSolver(GRID, dictionary=DICTIONARY)
+    instrumentation = solver.instrument()
+    snapshots(solver)
+    instrumentation.reset()
+    report = instrumentation.report()
+    assert report["nodes"] == report["pattern_matches"] == 0
+    assert report["timings"] == {} and report["domain_sizes"] == []
@@ -0,0 +1,26 @@
+import random
+
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("words", [
+    ["cat", "car", "cot", "arc", "tar", "scat", "cast", "cart", "a", "at"],
+    # Not latin-1 encodable: stored as code points instead of bytes.
+    ["ząb", "zab", "żab", "cat", "łódź", "lodz"],
+])
+def test_matches_the_bitset_index(words):
+    dictionary = Dictionary(words)
+    numpy_index, index = dictionary.numpy_index, dictionary.word_index
+    letters = sorted({letter for word in words for letter in word}) + ["ž"]
+    rng = random.Random(0)
+    for _ in range(300):
+        length = rng.randint(1, 6)
+        pattern = [rng.choice(letters) if rng.random() < 0.3 else "" for _ in range(length)]
+        assert numpy_index.match_ids(length, pattern) == index.match_ids(length, pattern)
+        assert numpy_index.match(length, pattern) == index.match(length, pattern)
+        assert numpy_index.count(length, pattern) == index.count(length, pattern)
@@ -0,0 +1,41 @@
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import CrosswordSolver
+from src.solver.events import FAILED, SOLVED
+from src.solver.parallel import ParallelCrosswordSolver, split_assignments
+
+
+WORDS = ["cat", "car", "cot", "arc", "tar", "rat", "bat", "ore", "ate", "toe", "ear", "era"]
+GRID = [list("   "), list(" # "), list("   ")]
+
+
+def test_branches_cover_the_top_of_the_tree():
+    solver = CrosswordSolver(GRID, dictionary=Dictionary(WORDS))
+    branches = split_assignments(solver, min_tasks=4)
+    assert len(branches) >= 2
+    assert len({tuple(sorted(branch.items())) for branch in branches}) == len(branches)
+    for branch in branches:
+        state = solver.new_state(branch)
+        assert len(state) == len(branch)
+        assert all(word in solver.dictionary for word in branch.values())
+    # The sequential search's solution lies under one of the branches.
+    solution = solver.solve_bounded().assignment
+    assert any(branch.items() <= solution.items() for branch in branches)
+
+
+def test_finds_a_solution():
+    solver = ParallelCrosswordSolver(GRID, dictionary=Dictionary(WORDS), workers=2)
+    root, solution = solver.solve()
+    assert root == {}
+    assert set(solution) == set(solver.variables)
+    grid = solver.get_grid_with_solution(solution)
+    for (r, c, direction, length), word in solution.items():
+        cells = [grid[r][c + i] if direction == "across" else grid[r + i][c]
+                 for i in range(length)]
+        assert "".join(cells) == word
+    assert list(solver.solve_events())[-1].kind == SOLVED
+
+
+def test_unsatisfiable():
+    solver = ParallelCrosswordSolver(GRID, dictionary=Dictionary(WORDS[:3]), workers=2)
+    assert list(solver.solve()) == [{}]
+    assert list(solver.solve_events())[-1].kind == FAILED
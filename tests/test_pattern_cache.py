@@ -0,0 +1,79 @@
+from src.dictionary.dictionary import Dictionary
+from src.dictionary.pattern_cache import PatternCache
+from src.solver.backtracking import CrosswordSolver
+
+
+WORDS = ["cat", "car", "cot", "arc", "tar", "rat", "bat", "scat", "cast", "cart"]
+
+
+def make_cache(**options):
+    return PatternCache(Dictionary(WORDS).word_index, **options)
+
+
+def test_results_match_the_index():
+    cache = make_cache()
+    index = cache.index
+    for length, pattern in [(3, ["c", "", ""]), (3, ["", "a", "t"]), (4, ["", "", "", ""]),
+                            (5, ["", "", "", "", ""])]:
+        assert cache.match_ids(length, pattern) == index.match_ids(length, pattern)
+        assert cache.count(length, pattern) == index.count(length, pattern)
+        assert cache.match(length, pattern) == index.match(length, pattern)
+
+
+def test_hits_and_misses():
+    cache = make_cache()
+    cache.count(3, ["c", "", ""])
+    cache.count(3, ["c", "", ""])
+    cache.match_ids(3, ["c", "", ""])
+    cache.match_ids(3, ["c", "", ""])
+    # Counts are answered from a cached id list.
+    cache.count(3, ["c", "", ""])
+    assert cache.stats() == {
+        "id_entries": 1, "stored_ids": 3, "id_hits": 1, "id_misses": 1,
+        "count_entries": 1, "count_hits": 2, "count_misses": 1,
+    }
+
+
+def test_keys_copy_the_pattern():
+    cache = make_cache()
+    pattern = ["c", "", ""]
+    assert cache.count(3, pattern) == 3
+    pattern[0] = "b"
+    assert cache.count(3, pattern) == 1
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = make_cache(max_entries=2)
+    cache.match_ids(3, ["c", "", ""])
+    cache.match_ids(3, ["", "a", ""])
+    cache.match_ids(3, ["c", "", ""])
+    cache.match_ids(3, ["", "", "t"])
+    assert cache.stats()["id_entries"] == 2
+    cache.match_ids(3, ["c", "", ""])
+    cache.match_ids(3, ["", "a", ""])
+    assert cache.stats()["id_hits"] == 2
+    assert cache.stats()["id_misses"] == 4
+
+
+def test_stored_ids_stay_within_budget():
+    cache = make_cache(max_ids=4)
+    cache.match_ids(3, ["", "", ""])  # 7 ids: too large to keep
+    assert cache.stats()["id_entries"] == 0
+    cache.match_ids(3, ["c", "", ""])
+    cache.match_ids(3, ["", "a", "t"])
+    stats = cache.stats()
+    assert stats["stored_ids"] <= 4 and stats["id_entries"] == 1
+
+
+def test_instrumentation_reports_cache_use_of_its_solve():
+    dictionary = Dictionary(WORDS)
+    grid = [list("   "), list(" # "), list("   ")]
+    CrosswordSolver(grid, dictionary=dictionary).solve_bounded()
+
+    solver = CrosswordSolver(grid, dictionary=dictionary)
+    instrumentation = solver.instrument()
+    for _ in solver.solve():
+        pass
+    stats = instrumentation.report()["pattern_cache"]
+    assert stats["id_misses"] == stats["count_misses"] == 0
+    assert stats["id_hits"] + stats["count_hits"] == instrumentation.pattern_matches
@@ -0,0 +1,98 @@
+"""Every search mode must agree with plain backtracking.
+
+Small random dictionaries over a three-letter alphabet and random small
+grids give a mix of solvable and unsatisfiable instances that plain
+backtracking settles exhaustively; backjumping, nogood learning and
+inference may prune the search but never change the answer.
+"""
+import random
+
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import INFERENCE_MODES, VALUE_ORDERS, CrosswordSolver
+from src.solver.budget import SolveStatus
+from src.solver.nogoods import NogoodStore
+
+
+INSTANCES = 150
+MODES = [
+    {"inference": inference, "backjumping": backjumping, "value_order": value_order}
+    for inference in INFERENCE_MODES
+    for backjumping in (False, True)
+    for value_order in VALUE_ORDERS
+]
+
+
+def random_instance(rng):
+    words = {
+        "".join(rng.choice("abc") for _ in range(rng.choice((2, 3, 4))))
+        for _ in range(rng.randint(4, 30))
+    }
+    size = rng.randint(2, 4)
+    grid = [
+        ["#" if rng.random() < 0.2 else (rng.choice("abc") if rng.random() < 0.1 else " ")
+         for _ in range(size)]
+        for _ in range(size)
+    ]
+    return Dictionary(words), grid
+
+
+def slot_letters(grid, var):
+    r, c, direction, length = var
+    if direction == "across":
+        return "".join(grid[r][c + i] for i in range(length))
+    return "".join(grid[r + i][c] for i in range(length))
+
+
+def assert_valid_solution(solver, dictionary, assignment):
+    assert set(assignment) == set(solver.variables)
+    assert len(set(assignment.values())) == len(assignment)
+    solved = solver.get_grid_with_solution(assignment)
+    for var, word in assignment.items():
+        assert word in dictionary and len(word) == var[3]
+        assert slot_letters(solved, var) == word
+    for row, solved_row in zip(solver.grid, solved):
+        for cell, solved_cell in zip(row, solved_row):
+            assert cell in (" ", solved_cell)
+
+
+def instances():
+    rng = random.Random(2024)
+    return [random_instance(rng) for _ in range(INSTANCES)]
+
+
+@pytest.mark.parametrize(
+    "options", MODES, ids=lambda options: "-".join(str(value) for value in options.values()))
+def test_modes_agree_with_backtracking(options):
+    outcomes = set()
+    for dictionary, grid in instances():
+        expected = CrosswordSolver(grid, dictionary=dictionary).solve_bounded().status
+        solver = CrosswordSolver(grid, dictionary=dictionary, **options)
+        result = solver.solve_bounded()
+        assert result.status == expected, (grid, sorted(dictionary.words))
+        if result.solved:
+            assert_valid_solution(solver, dictionary, result.assignment)
+        outcomes.add(expected)
+    # The corpus exercises both answers.
+    assert outcomes == {SolveStatus.SOLVED, SolveStatus.UNSATISFIABLE}
+
+
+def test_nogood_store():
+    nogoods = NogoodStore(max_size=2, max_nogoods=2)
+    word_ids = [3, 5, 7]
+    nogoods.add(word_ids, {0, 1})
+    nogoods.add(word_ids, {0, 1, 2})  # longer than max_size: not kept
+    assert len(nogoods) == 1
+
+    # Variable 1 taking word 5 again while variable 0 still holds word 3.
+    assert nogoods.find_violated(1, 5, [3, -1, 7]) == {0, 1}
+    assert nogoods.find_violated(1, 5, [4, -1, 7]) is None
+    assert nogoods.find_violated(1, 6, [3, -1, 7]) is None
+    assert nogoods.hits == 1
+
+    nogoods.add(word_ids, {2})
+    nogoods.add(word_ids, {1})  # store full
+    assert len(nogoods) == 2
+    assert nogoods.find_violated(2, 7, [-1, -1, -1]) == {2}
+    assert nogoods.find_violated(1, 5, [-1, -1, -1]) is None
@@ -0,0 +1,64 @@
+import asyncio
+import queue
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from src.service import app as service
+from src.service import workers
+from src.service.pool import Channel, WorkerPool
+
+
+def start_service(monkeypatch, word_file=None):
+    monkeypatch.setattr(service, "WORKERS", 1)
+    monkeypatch.setattr(service, "MAX_QUEUE", 4)
+    monkeypatch.setattr(service, "CACHE_SIZE", 0)
+    monkeypatch.setattr(service, "WORD_FILE", word_file and str(word_file))
+    return TestClient(service.app)
+
+
+def test_generate_grid_wider_than_longest_word(monkeypatch):
+    with start_service(monkeypatch) as client:
+        response = client.post("/generate", json={"size": 25, "num_words": 5, "seed": 3})
+    assert response.status_code == 200
+    assert len(response.json()["grid"]) == 25
+
+
+def test_generate_unfillable_grid_is_a_client_error(monkeypatch, tmp_path):
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("crosswords\npuzzlement\n")
+    with start_service(monkeypatch, word_file) as client:
+        response = client.post("/generate", json={"size": 5, "num_words": 3, "seed": 1})
+    assert response.status_code == 422
+
+
+def test_stream_delivers_messages_sent_as_the_task_ends(monkeypatch):
+    # A reader that never sees a message in time: everything the task sent
+    # must still arrive once it has finished.
+    def receive_nothing(self, timeout):
+        time.sleep(timeout)
+        raise queue.Empty
+
+    monkeypatch.setattr(Channel, "receive", receive_nothing)
+
+    async def collect():
+        pool = WorkerPool(1, 2)
+        await pool.start()
+        try:
+            stream = pool.stream(
+                workers.stream_solve, ["   ", " # ", "   "], 5.0, None, False, None, 10.0,
+                timeout=10.0,
+            )
+            return [message async for message in stream]
+        finally:
+            pool.shutdown()
+
+    messages = asyncio.run(collect())
+    assert messages[0]["type"] == "start"
+    assert messages[-1]["type"] == "done"
+    assert messages[-1]["status"] == "solved"
@@ -0,0 +1,68 @@
+import random
+
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import CrosswordSolver
+
+
+DICTIONARY = Dictionary(["cat"])
+
+
+def reference_slots(grid):
+    """Maximal runs of two or more white cells, found the slow way."""
+    height, width = len(grid), len(grid[0])
+    slots = {}
+    for direction, dr, dc in (("across", 0, 1), ("down", 1, 0)):
+        for r in range(height):
+            for c in range(width):
+                if grid[r][c] == "#":
+                    continue
+                if 0 <= r - dr and 0 <= c - dc and grid[r - dr][c - dc] != "#":
+                    continue
+                cells = []
+                while r + dr * len(cells) < height and c + dc * len(cells) < width \
+                        and grid[r + dr * len(cells)][c + dc * len(cells)] != "#":
+                    cells.append((r + dr * len(cells), c + dc * len(cells)))
+                if len(cells) > 1:
+                    slots[(r, c, direction, len(cells))] = cells
+    return slots
+
+
+def test_slots_and_crossings_match_a_brute_force_scan():
+    rng = random.Random(7)
+    for _ in range(200):
+        height, width = rng.randint(1, 9), rng.randint(1, 9)
+        density = rng.random() * 0.5
+        grid = [["#" if rng.random() < density else rng.choice(" a") for _ in range(width)]
+                for _ in range(height)]
+        solver = CrosswordSolver(grid, dictionary=DICTIONARY)
+        slots = reference_slots(solver.grid)
+
+        assert set(solver.variables) == set(slots)
+        assert len(solver.variables) == len(slots)
+        for var, cells in zip(solver.variables, solver.slot_cells):
+            assert list(cells) == slots[var]
+
+        expected = {}
+        for across, across_cells in slots.items():
+            for down, down_cells in slots.items():
+                if across[2] == "across" and down[2] == "down":
+                    for cell in set(across_cells) & set(down_cells):
+                        expected[(across, down)] = (
+                            across_cells.index(cell), down_cells.index(cell))
+        assert solver.intersections == expected
+
+        for index, var in enumerate(solver.variables):
+            crossings = [
+                (solver.variables[other], offset, other_offset)
+                for other, offset, other_offset in solver.crossings[index]
+            ]
+            assert sorted(solver.variable_intersections[var]) == sorted(
+                other for other, _, _ in crossings)
+            for other, offset, other_offset in crossings:
+                assert slots[var][offset] == slots[other][other_offset]
+
+
+def test_ragged_rows_are_padded_with_blocks():
+    solver = CrosswordSolver([list("   "), list(" "), list("   ")], dictionary=DICTIONARY)
+    assert solver.grid[1] == [" ", "#", "#"]
+    assert solver.variables == [(0, 0, "across", 3), (0, 0, "down", 3), (2, 0, "across", 3)]
@@ -0,0 +1,87 @@
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import CrosswordSolver
+from src.solver.budget import SolveStatus
+from src.solver.solution_cache import SolutionCache, canonical_grid, transpose
+
+
+DICTIONARY = Dictionary([
+    "cat", "car", "cot", "arc", "tar", "rat", "ore", "ate", "ear", "toe",
+    "at", "to", "ar", "re", "or", "ta",
+])
+GRID = ["   ", " # ", "#  "]
+
+
+def solver_for(rows, dictionary=DICTIONARY):
+    return CrosswordSolver([list(row) for row in rows], dictionary=dictionary)
+
+
+def test_canonical_grid():
+    rows, transposed = canonical_grid([list(row) for row in GRID])
+    other, other_transposed = canonical_grid([list(row) for row in transpose(GRID)])
+    assert rows == other and transposed != other_transposed
+
+
+def test_hit_and_miss():
+    cache = SolutionCache()
+    first = cache.solve_bounded(solver_for(GRID))
+    assert first.status == SolveStatus.SOLVED
+    again = cache.solve_bounded(solver_for(GRID))
+    assert again.assignment == first.assignment
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_transposed_grid_shares_the_entry():
+    cache = SolutionCache()
+    cache.solve_bounded(solver_for(GRID))
+    solver = solver_for(transpose(GRID))
+    result = cache.get(solver)
+    assert result.solved and set(result.assignment) == set(solver.variables)
+    grid = solver.get_grid_with_solution(result.assignment)
+    for (r, c, direction, length), word in result.assignment.items():
+        cells = [grid[r][c + i] if direction == "across" else grid[r + i][c]
+                 for i in range(length)]
+        assert "".join(cells) == word and word in DICTIONARY
+
+
+def test_only_definite_outcomes_are_cached():
+    cache = SolutionCache()
+    unsat = cache.solve_bounded(solver_for(["zzz"]))
+    assert unsat.status == SolveStatus.UNSATISFIABLE
+    assert cache.get(solver_for(["zzz"])).status == SolveStatus.UNSATISFIABLE
+
+    cache.solve_bounded(solver_for(["   "]), node_limit=1)
+    assert cache.get(solver_for(["   "])) is None
+
+
+def test_keys_include_the_dictionary():
+    cache = SolutionCache()
+    cache.solve_bounded(solver_for(GRID))
+    assert cache.get(solver_for(GRID, Dictionary(["cat"]))) is None
+
+
+def test_lru_eviction():
+    cache = SolutionCache(max_entries=1)
+    cache.solve_bounded(solver_for(GRID))
+    cache.solve_bounded(solver_for(["zzz"]))
+    assert len(cache) == 1
+    assert cache.get(solver_for(GRID)) is None
+
+
+def test_sqlite_persists_across_instances(tmp_path):
+    path = tmp_path / "solutions.sqlite"
+    solved = SolutionCache(path=path).solve_bounded(solver_for(GRID))
+    cache = SolutionCache(path=path)
+    assert cache.get(solver_for(GRID)).assignment == solved.assignment
+    assert cache.hits == 1
+
+    cache.clear()
+    assert SolutionCache(path=path).get(solver_for(GRID)) is None
+
+
+def test_sqlite_trims_least_recently_used(tmp_path):
+    cache = SolutionCache(max_entries=1, path=tmp_path / "solutions.sqlite", max_disk_entries=2)
+    for word in ("cat", "car", "cot"):
+        cache.solve_bounded(solver_for([word]))
+    assert cache._disk_entries <= 2
+    assert cache.get(solver_for(["cat"])) is None
+    assert cache.get(solver_for(["cot"])).solved
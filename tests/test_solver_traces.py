@@ -0,0 +1,61 @@
+"""Golden search traces.
+
+Each digest covers every assignment ``solve()`` yields, with its insertion
+order, for the first 300 nodes of a few grids against the bundled word
+list. The digests were recorded before the solver moved to SearchState and
+must only change when the search order is changed on purpose.
+"""
+import hashlib
+import itertools
+
+import pytest
+
+from src.solver.backtracking import CrosswordSolver
+
+
+GRIDS = {
+    "open4": ["    ", "    ", "    ", "    "],
+    "blocked5": ["     ", " # # ", "     ", " # # ", "     "],
+    "symmetric7": ["   #   ", "       ", "   #   ", "## # ##", "   #   ", "       ", "   #   "],
+    "given_letters": ["c  #   ", "       ", "   #  e", "## # ##", "s  #   ", "       ", "   #  y"],
+}
+INITIAL_ASSIGNMENT = {(0, 0, "across", 3): "abs", (0, 2, "down", 7): "sarcasm"}
+NODES = 300
+
+GOLDEN = {
+    "backtracking": ({}, "9d413a083aa6866c3d243b3a87a48438ca464b6c"),
+    "backjumping": ({"backjumping": True}, "7b8171aa4daede215c19d637b05e517e07fd305c"),
+    "forward_checking": (
+        {"inference": "forward_checking"}, "c7b9dc7dfa4d9ed0f26a815db912704bc57c7ade"),
+    "ac3": ({"inference": "ac3"}, "95936785e25c7b6dd5e96097f468877dd6f0fd2f"),
+    "forward_checking_backjumping": (
+        {"inference": "forward_checking", "backjumping": True},
+        "9d175074483a5e9f0832c6f08bc7ce8f9d9d2a22",
+    ),
+    "ac3_backjumping": (
+        {"inference": "ac3", "backjumping": True}, "95936785e25c7b6dd5e96097f468877dd6f0fd2f"),
+}
+
+
+def trace_digest(options) -> str:
+    digest = hashlib.sha1()
+    runs = [(rows, None) for rows in GRIDS.values()]
+    runs.append((GRIDS["symmetric7"], INITIAL_ASSIGNMENT))
+    for rows, initial_assignment in runs:
+        solver = CrosswordSolver([list(row) for row in rows], **options)
+        for assignment in itertools.islice(solver.solve(initial_assignment), NODES):
+            digest.update(repr(list(assignment.items())).encode())
+    return digest.hexdigest()
+
+
+@pytest.mark.parametrize("mode", GOLDEN)
+def test_search_trace_is_unchanged(mode):
+    options, expected = GOLDEN[mode]
+    assert trace_digest(options) == expected
+
+
+@pytest.mark.parametrize("mode", ["backtracking", "forward_checking"])
+def test_numpy_backend_follows_the_same_search(mode):
+    pytest.importorskip("numpy")
+    options, expected = GOLDEN[mode]
+    assert trace_digest({**options, "backend": "numpy"}) == expected
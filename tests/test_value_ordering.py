@@ -0,0 +1,49 @@
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import BACKENDS, INFERENCE_MODES, CrosswordSolver
+from src.solver.budget import SolveStatus
+from src.solver.value_ordering import LeastConstrainingValue
+
+
+WORDS = ["cat", "car", "arc", "tar", "rat", "act", "art", "tic", "aaaaa", "bbbbb"]
+
+# 5-letter rows crossing 2-letter columns, which the dictionary has no words for.
+MISSING_LENGTH_GRID = ["  #  ", "     ", "#   #", "     ", "  #  "]
+
+
+def test_open_crossing_of_missing_length_has_no_support():
+    ordering = LeastConstrainingValue(Dictionary(WORDS).word_index)
+    assert ordering.supports(2, 0, ["", ""]) == {}
+    assert ordering.supports(2, 1, ["a", ""]) == {}
+    assert ordering.supports(3, 0, ["", "", "t"]) == {"a": 2, "c": 1, "r": 1}
+
+
+def test_order_puts_best_supported_candidates_first():
+    dictionary = Dictionary(WORDS)
+    ordering = LeastConstrainingValue(dictionary.word_index)
+    words = dictionary.words_by_length[3]
+    candidates = list(range(len(words)))
+    # One crossing whose first letter sits at the candidate's last letter.
+    ranked = ordering.order(words, candidates, [(2, 3, 0, ["", "", ""])])
+    first_letters = ordering.supports(3, 0, ["", "", ""])
+    scores = [first_letters.get(words[word_id][2], 0) for word_id in ranked]
+    assert scores == sorted(scores, reverse=True)
+    assert sorted(ranked) == candidates
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("inference", INFERENCE_MODES)
+@pytest.mark.parametrize("backjumping", [False, True])
+def test_lcv_with_slot_length_missing_from_dictionary(backend, inference, backjumping):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    solver = CrosswordSolver(
+        [list(row) for row in MISSING_LENGTH_GRID],
+        dictionary=Dictionary(WORDS),
+        inference=inference,
+        backjumping=backjumping,
+        backend=backend,
+        value_order="lcv",
+    )
+    assert solver.solve_bounded(node_limit=10_000).status == SolveStatus.UNSATISFIABLE
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from src.dictionary.dictionary import Dictionary
+from src.solver.backtracking import INFERENCE_MODES, CrosswordSolver
+from src.solver.budget import SolveStatus
+
+
+WORDS = ["cat", "car", "arc", "tar", "rat", "act", "scat", "cast"]
+
+# Has 2-letter slots, a length the dictionary has no words for.
+MISSING_LENGTH_GRID = ["  #  ", "     ", "#   #", "     ", "  #  "]
+
+
+def test_patterns_match_a_linear_scan():
+    index = Dictionary(WORDS).word_index
+    rng = random.Random(0)
+    for _ in range(300):
+        length = rng.randint(2, 5)
+        pattern = [rng.choice("acrstz") if rng.random() < 0.4 else "" for _ in range(length)]
+        expected = [
+            word for word in sorted(WORDS)
+            if len(word) == length and all(p in ("", c) for p, c in zip(pattern, word))
+        ]
+        assert index.match(length, pattern) == expected
+        assert index.count(length, pattern) == len(expected)
+        assert [index.word_id(word) for word in expected] == index.match_ids(length, pattern)
+    assert index.word_id("dog") is None
+
+
+def test_letters_at_missing_length_is_empty():
+    index = Dictionary(WORDS).word_index
+    assert index.letters_at(2, 0, -1) == []
+    assert index.letters_at(3, 0, index.full_masks[3]) == ["a", "c", "r", "t"]
+
+
+@pytest.mark.parametrize("inference", INFERENCE_MODES)
+@pytest.mark.parametrize("backjumping", [False, True])
+def test_slot_length_missing_from_dictionary_is_unsatisfiable(inference, backjumping):
+    solver = CrosswordSolver(
+        [list(row) for row in MISSING_LENGTH_GRID],
+        dictionary=Dictionary(WORDS),
+        inference=inference,
+        backjumping=backjumping,
+    )
+    assert solver.solve_bounded(node_limit=10_000).status == SolveStatus.UNSATISFIABLE
@@ -0,0 +1,15 @@
+from src.dictionary.word_loader import clear_dictionary_cache, get_dictionary
+
+
+def test_one_dictionary_per_word_file(tmp_path, monkeypatch):
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("cat\ncar\n\nno-dash\n")
+    clear_dictionary_cache()
+    dictionary = get_dictionary(word_file)
+    monkeypatch.chdir(tmp_path)
+    assert get_dictionary("words.txt") is dictionary
+    assert dictionary.words == {"cat", "car"}
+    assert dictionary.words_by_length == {3: ("car", "cat")}
+
+    clear_dictionary_cache()
+    assert get_dictionary(word_file) is not dictionary